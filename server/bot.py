@@ -24,17 +24,32 @@ Run the bot using::
 
 import os
 import argparse
+import asyncio
+import copy
+import functools
+import time
 import uuid
+from dataclasses import dataclass
+from typing import Dict, List
 
+from deepgram import LiveOptions
 from dotenv import load_dotenv
 from loguru import logger
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
 from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.frames.frames import (
+    BotInterruptionFrame,
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    Frame,
+    InterimTranscriptionFrame,
+)
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIObserver, RTVIProcessor
 from pipecat.runner.types import RunnerArguments
 from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
@@ -47,7 +62,7 @@ from pipecat.processors.transcript_processor import TranscriptProcessor
 from pipecat.utils.tracing.setup import setup_tracing
 
 from prompts_loader import PromptsRepository
-from coach import GeminiCoach, ConversationState
+from coach import CoachBatcher, GeminiCoach, ConversationState
 from session_logger import SessionLogger
 from conversation_aggregator import ConversationAggregator
 from guardrail_service import GuardrailService
@@ -68,22 +83,199 @@ if IS_TRACING_ENABLED:
     )
     logger.info("OpenTelemetry tracing initialized for Langfuse")
 
-REQUIRED_ENV_KEYS = [
-    "DEEPGRAM_API_KEY",
-    "OPENAI_API_KEY",
-    "ELEVENLABS_API_KEY",
-    "ELEVENLABS_VOICE_ID",
-    "GEMINI_API_KEY",
-]
+# BotConfig field -> environment variable
+_ENV_KEYS = {
+    "deepgram_key": "DEEPGRAM_API_KEY",
+    "openai_key": "OPENAI_API_KEY",
+    "elevenlabs_key": "ELEVENLABS_API_KEY",
+    "elevenlabs_voice": "ELEVENLABS_VOICE_ID",
+    "gemini_key": "GEMINI_API_KEY",
+}
+REQUIRED_ENV_KEYS = list(_ENV_KEYS.values())
 
-async def run_bot(transport: BaseTransport, scenario: str):
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Service credentials, resolved once from the environment at startup."""
+
+    deepgram_key: str
+    openai_key: str
+    elevenlabs_key: str
+    elevenlabs_voice: str
+    gemini_key: str
+
+    @classmethod
+    def from_env(cls) -> "BotConfig":
+        return cls(**{field: os.environ.get(env, "") for field, env in _ENV_KEYS.items()})
+
+    def missing(self) -> List[str]:
+        """Names of required environment variables that are not set."""
+        return [env for field, env in _ENV_KEYS.items() if not getattr(self, field)]
+
+    def validate(self) -> None:
+        """Exit with an error if any required environment variable is missing."""
+        missing = self.missing()
+        if missing:
+            missing_list = ", ".join(missing)
+            logger.error(f"Missing required environment variables: {missing_list}")
+            raise SystemExit(2)
+
+
+CFG = BotConfig.from_env()
+
+
+@functools.lru_cache(maxsize=None)
+def _prompts() -> PromptsRepository:
+    """Prompts repository shared by every session, loaded on first use."""
+    return PromptsRepository()
+
+
+# Flattens prompt heads onto a single log line
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+# One LLM context per scenario holding only the static persona system message.
+# Sessions deep-copy their template; the persona message is never mutated so
+# OpenAI's automatic prefix caching can reuse it across turns and sessions.
+_CONTEXT_TEMPLATES: Dict[str, OpenAILLMContext] = {}
+
+
+def _context_template(scenario: str) -> OpenAILLMContext:
+    """Return the scenario's context template, building it on first use.
+
+    Raises KeyError for a scenario without a persona prompt.
+    """
+    template = _CONTEXT_TEMPLATES.get(scenario)
+    if template is None:
+        persona_system = _prompts().persona_system_prompt_for_scenario(scenario)
+        template = _CONTEXT_TEMPLATES[scenario] = OpenAILLMContext(
+            [{"role": "system", "content": persona_system}]
+        )
+    return template
+
+
+@functools.lru_cache(maxsize=16)
+def _persona_name(scenario: str) -> str:
+    """Display name of the simulated customer for a scenario."""
+    return _prompts().find(entity="simulation_customer", scenario=scenario)[0].persona or ""
+
+
+class InterimFilterProcessor(FrameProcessor):
+    """Records interim STT transcriptions for debugging and passes every frame through.
+
+    Interims are only logged; final transcriptions continue downstream to the
+    transcript processor, which drives coach evaluation.
+    """
+
+    def __init__(self, session_logger: SessionLogger, **kwargs):
+        super().__init__(**kwargs)
+        self._session_logger = session_logger
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        # Exact-type dispatch: one dict lookup instead of an isinstance MRO walk per frame
+        handler = _INTERIM_FILTER_HANDLERS.get(frame.__class__)
+        if handler is not None:
+            handler(self, frame)
+
+        await self.push_frame(frame, direction)
+
+    def _handle_interim(self, frame: InterimTranscriptionFrame):
+        text = frame.text
+        # Deepgram emits many empty interims; drop them before any logging work
+        if not text:
+            return
+        logger.debug("[TRANSCRIPT-INTERIM] User {}: {}", frame.user_id, text)
+        self._session_logger.append_transcript("user", text, is_interim=True)
+
+
+_INTERIM_FILTER_HANDLERS = {
+    InterimTranscriptionFrame: InterimFilterProcessor._handle_interim,
+}
+
+
+# Minimum gap between Deepgram-triggered interruptions. SpeechStarted fires on every
+# noise burst, and one interruption already ends the bot's turn.
+_BARGE_IN_MIN_INTERVAL_S = 1.0
+
+
+class BargeInGate(FrameProcessor):
+    """Tracks whether the bot is speaking so speech onset only interrupts a live bot turn.
+
+    Deepgram's SpeechStarted event also fires on background noise and on echo of the
+    bot's own audio, so an interruption is only requested while the bot is speaking
+    and at most once per `min_interval` seconds.
+    """
+
+    def __init__(self, min_interval: float = _BARGE_IN_MIN_INTERVAL_S, **kwargs):
+        super().__init__(**kwargs)
+        self._min_interval = min_interval
+        self._bot_speaking = False
+        self._last_interrupt = float("-inf")
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        # The output transport pushes these upstream, past the STT service
+        if frame.__class__ is BotStartedSpeakingFrame:
+            self._bot_speaking = True
+        elif frame.__class__ is BotStoppedSpeakingFrame:
+            self._bot_speaking = False
+
+        await self.push_frame(frame, direction)
+
+    def should_interrupt(self) -> bool:
+        """Return True (and start a new debounce window) if an interruption is due."""
+        if not self._bot_speaking:
+            return False
+        now = time.monotonic()
+        if now - self._last_interrupt < self._min_interval:
+            return False
+        self._last_interrupt = now
+        return True
+
+
+async def _run_coach_turn(
+    coach: GeminiCoach,
+    batcher: CoachBatcher,
+    session_logger: SessionLogger,
+    customer_prompt: str,
+    representative_response: str,
+):
+    """Evaluate one completed turn and persist the coaching feedback."""
+    try:
+        # Ensure coach is running (lazy start on first need)
+        await coach.ensure_started()
+        eval_res = await batcher.submit(
+            customer_prompt,  # What the customer (assistant) said
+            representative_response,  # How the bank rep (user) responded
+        )
+        if eval_res and eval_res.parsed:
+            session_logger.append_coach_turn(
+                eval_res.turn_number,
+                customer_prompt,  # Customer (assistant) message
+                representative_response,  # Bank rep (user) response
+                eval_res.parsed,
+            )
+            logger.info(f"[COACH] Turn {eval_res.turn_number} evaluation saved to {session_logger.per_turn_jsonl_path}")
+        elif eval_res:
+            logger.warning(f"[COACH] Turn {eval_res.turn_number} evaluation failed or unparseable")
+    except Exception as e:
+        logger.error(f"[COACH] Evaluation error: {e}", exc_info=True)
+
+
+async def run_bot(transport: BaseTransport, scenario: str, config: BotConfig = CFG):
     logger.info(f"Starting bot")
 
-    stt = DeepgramSTTService(api_key=os.getenv("DEEPGRAM_API_KEY"))
+    # Deepgram VAD events let us barge in on speech onset (see on_speech_started)
+    stt = DeepgramSTTService(
+        api_key=config.deepgram_key,
+        live_options=LiveOptions(vad_events=True),
+    )
 
     tts = ElevenLabsTTSService(
-        api_key=os.getenv("ELEVENLABS_API_KEY"),
-        voice_id=os.getenv("ELEVENLABS_VOICE_ID"),
+        api_key=config.elevenlabs_key,
+        voice_id=config.elevenlabs_voice,
         model="eleven_flash_v2_5", # 50% cheaper, fast, english only -> should be fine while english main language -> known limitation if not
         params=ElevenLabsTTSService.InputParams(
             language=Language.EN,
@@ -99,7 +291,7 @@ async def run_bot(transport: BaseTransport, scenario: str):
 
     # GPT-4.1-nano for speed & cost, intelligent enough for a simple persona
     # and can be managed via determinism params - see below:
-    llm = OpenAILLMService(api_key=os.getenv("OPENAI_API_KEY"),
+    llm = OpenAILLMService(api_key=config.openai_key,
         model="gpt-4.1-nano",
         params=BaseOpenAILLMService.InputParams(
             temperature=0.4,            # Response creativity (0.0-2.0)
@@ -112,7 +304,7 @@ async def run_bot(transport: BaseTransport, scenario: str):
     )
 
     # Load persona prompt based on scenario
-    prompts_repo = PromptsRepository()
+    prompts_repo = _prompts()
     
     # Apply guardrails from prompts.json
     guardrail_service = GuardrailService(prompts_repo)
@@ -124,78 +316,60 @@ async def run_bot(transport: BaseTransport, scenario: str):
         logger.info(
             f"Scenario loaded: '{scenario}' | Persona: {info.get('persona')} | Description: {info.get('brief')}"
         )
+        persona_system = prompts_repo.persona_system_prompt_for_scenario(scenario)
+        context = copy.deepcopy(_context_template(scenario))
     except Exception as e:
         logger.error(f"Failed to load scenario info: {e}")
         raise
-    persona_system = prompts_repo.persona_system_prompt_for_scenario(scenario)
-    print(f"Persona system: {persona_system}")
-
-    messages = [
-        {
-            "role": "system",
-            "content": persona_system,
-        },
-    ]
+    logger.opt(lazy=True).debug(
+        "Persona system (head): {}", lambda: persona_system[:160].translate(_NL_TABLE)
+    )
 
-    context = OpenAILLMContext(messages)
     context_aggregator = llm.create_context_aggregator(context)
 
     rtvi = RTVIProcessor(config=RTVIConfig(config=[]))
     transcript = TranscriptProcessor()  # Regular transcript processor
 
     # Coach setup (Gemini)
-    coach = GeminiCoach(prompts_repo)
+    coach = GeminiCoach(prompts_repo, api_key=config.gemini_key)
     conv_state = ConversationState(
         scenario=scenario,
-        persona_name=prompts_repo.find(entity="simulation_customer", scenario=scenario)[0].persona or "",
+        persona_name=_persona_name(scenario),
     )
     # Attempt eager start; if it fails, we'll try again lazily on first turn
     try:
         await coach.start()
     except Exception as e:
         logger.warning(f"[COACH] Deferred start (will retry on first turn): {e}")
+    # Turns completing close together are scored in a single Gemini request
+    coach_batcher = CoachBatcher(coach, conv_state)
+    coach_tasks = set()
 
     # Session logger
     session_logger = SessionLogger(scenario=scenario)
-    logger.info(f"[COACH] Session logging directory: {session_logger.base_dir}")
-    logger.info(f"[COACH] Transcript file (final): {session_logger.transcript_path}")
-    logger.info(f"[COACH] Transcript file (with interims): {session_logger._interim_transcript_path}")
-    logger.info(f"[COACH] Per-turn file: {session_logger.per_turn_path}")
-    logger.info(f"[COACH] Session eval file: {session_logger._session_eval_path}")
+    logger.info(
+        "[COACH] Session {} paths: dir={} | transcript={} | interims={} | per-turn={} (final {}) | eval={}",
+        session_logger.session_id,
+        session_logger.base_dir,
+        os.path.relpath(session_logger.transcript_path, session_logger.base_dir),
+        os.path.relpath(session_logger._interim_transcript_path, session_logger.base_dir),
+        os.path.relpath(session_logger.per_turn_jsonl_path, session_logger.base_dir),
+        os.path.relpath(session_logger.per_turn_path, session_logger.base_dir),
+        os.path.relpath(session_logger._session_eval_path, session_logger.base_dir),
+    )
     
     # Create conversation aggregator to handle fragmented user messages
     conversation_aggregator = ConversationAggregator()
-    
-    # Monkey-patch the UserTranscriptProcessor to filter interim transcriptions
-    # while still logging them for debugging
-    user_processor = transcript.user()
-    original_process_frame = user_processor.process_frame
-    
-    async def filtered_process_frame(self, frame, direction=None):
-        from pipecat.frames.frames import InterimTranscriptionFrame, TranscriptionFrame
-        
-        if isinstance(frame, InterimTranscriptionFrame):
-            # Log interim transcription but don't process for transcript events
-            text = getattr(frame, 'text', '')
-            user_id = getattr(frame, 'user_id', 'unknown')
-            if text:
-                logger.debug(f"[TRANSCRIPT-INTERIM] User {user_id}: {text}")
-                session_logger.append_transcript("user", text, is_interim=True)
-            # Pass through the frame without processing
-            await self.push_frame(frame, direction)
-            return
-        
-        # Process final transcriptions normally
-        return await original_process_frame(frame, direction)
-    
-    # Apply the monkey-patch
-    user_processor.process_frame = filtered_process_frame.__get__(user_processor, user_processor.__class__)
 
+    barge_in = BargeInGate()
+    
     pipeline = Pipeline(
         [
             transport.input(),  # Transport user input
             rtvi,  # RTVI processor
             stt,
+            barge_in,  # Sees bot speaking state for Deepgram barge-in
+            InterimFilterProcessor(session_logger),  # Log interim transcriptions
             transcript.user(),              # Capture user transcripts
             context_aggregator.user(),  # User responses
             llm,  
@@ -206,9 +380,10 @@ async def run_bot(transport: BaseTransport, scenario: str):
         ]
     )
 
-    # Generate a conversation ID for tracking
-    conversation_id = str(uuid.uuid4())
-    logger.info(f"Conversation ID: {conversation_id}")
+    # Conversation ID is only used for tracing
+    conversation_id = uuid.uuid4().hex if IS_TRACING_ENABLED else None
+    if conversation_id:
+        logger.info(f"Conversation ID: {conversation_id}")
     
     task = PipelineTask(
         pipeline,
@@ -218,14 +393,26 @@ async def run_bot(transport: BaseTransport, scenario: str):
         ),
         observers=[RTVIObserver(rtvi)],
         enable_tracing=IS_TRACING_ENABLED,
-        conversation_id=conversation_id if IS_TRACING_ENABLED else None,
+        conversation_id=conversation_id,
     )
 
+    @stt.event_handler("on_speech_started")
+    async def on_speech_started(stt, *args, **kwargs):
+        # Interrupt in-flight LLM generation and TTS playback as soon as Deepgram
+        # hears the user, rather than waiting for the local VAD / final transcript.
+        # The Silero VAD path on the transport stays in place as the fallback.
+        if not barge_in.should_interrupt():
+            return
+        logger.debug("[STT] Deepgram speech started - interrupting bot")
+        await task.queue_frames([BotInterruptionFrame()])
+
     @transport.event_handler("on_client_connected")
     async def on_client_connected(transport, client):
         logger.info(f"Client connected")
         # Kick off the conversation.
-        messages.append({"role": "system", "content": persona_system + "\n\nSay hello and very briefly introduce yourself, and your problem, you are a customer in need, not interested in chatting,."})
+        # Keep the persona system message untouched so the prompt prefix stays
+        # stable (and cacheable); the greeting directive is a separate suffix.
+        context.add_message({"role": "system", "content": "Say hello and very briefly introduce yourself, and your problem, you are a customer in need, not interested in chatting,."})
         await task.queue_frames([context_aggregator.user().get_context_frame()])
 
     # Log final transcript updates (both user and assistant) - these are used for coach evaluation
@@ -240,37 +427,29 @@ async def run_bot(transport: BaseTransport, scenario: str):
             session_logger.append_transcript(role, content, is_interim=False)
             
             # Use aggregator to handle fragmented messages
-            turn_pair = conversation_aggregator.add_message(role, content)
+            turn = conversation_aggregator.add_message(role, content)
             
-            if turn_pair:
+            if turn:
                 # We have a complete turn ready for evaluation
-                # turn_pair = (customer_prompt, representative_response)
-                customer_prompt, representative_response = turn_pair
+                customer_prompt, representative_response = turn.customer, turn.rep
                 
-                logger.info(f"[COACH] Evaluating complete turn {conv_state.turn_index + 1}:")
-                logger.info(f"  Customer (assistant): {customer_prompt[:80]}...")
-                logger.info(f"  Representative (user): {representative_response[:80]}...")
+                logger.info("[COACH] Queueing complete turn for evaluation:")
+                logger.opt(lazy=True).info(
+                    "  Customer (assistant): {}...", lambda cp=customer_prompt: cp[:80]
+                )
+                logger.opt(lazy=True).info(
+                    "  Representative (user): {}...", lambda rr=representative_response: rr[:80]
+                )
                 
-                try:
-                    # Ensure coach is running (lazy start on first need)
-                    await coach.ensure_started()
-                    eval_res = await coach.evaluate_turn(
-                        conv_state,
-                        customer_prompt=customer_prompt,  # What the customer (assistant) said
-                        representative_response=representative_response,  # How the bank rep (user) responded
+                # Run the coach in the background so the next transcript frame
+                # isn't blocked behind the Gemini round-trip
+                coach_task = asyncio.create_task(
+                    _run_coach_turn(
+                        coach, coach_batcher, session_logger, customer_prompt, representative_response
                     )
-                    if eval_res and eval_res.parsed:
-                        session_logger.append_coach_turn(
-                            conv_state.turn_index,
-                            customer_prompt,  # Customer (assistant) message
-                            representative_response,  # Bank rep (user) response
-                            eval_res.parsed,
-                        )
-                        logger.info(f"[COACH] Turn {conv_state.turn_index} evaluation saved to {session_logger.per_turn_path}")
-                    else:
-                        logger.warning(f"[COACH] Turn {conv_state.turn_index} evaluation failed or unparseable")
-                except Exception as e:
-                    logger.error(f"[COACH] Evaluation error: {e}", exc_info=True)
+                )
+                coach_tasks.add(coach_task)
+                coach_task.add_done_callback(coach_tasks.discard)
 
     @transport.event_handler("on_client_disconnected")
     async def on_client_disconnected(transport, client):
@@ -279,28 +458,30 @@ async def run_bot(transport: BaseTransport, scenario: str):
             # Flush any pending turn for evaluation
             final_turn = conversation_aggregator.flush_pending_turn()
             if final_turn:
-                customer_prompt, representative_response = final_turn
-                logger.info(f"[COACH] Evaluating final turn {conv_state.turn_index + 1}:")
-                logger.info(f"  Customer (assistant): {customer_prompt[:80]}...")
-                logger.info(f"  Representative (user): {representative_response[:80]}...")
+                customer_prompt, representative_response = final_turn.customer, final_turn.rep
+                logger.info("[COACH] Evaluating final turn:")
+                logger.opt(lazy=True).info(
+                    "  Customer (assistant): {}...", lambda cp=customer_prompt: cp[:80]
+                )
+                logger.opt(lazy=True).info(
+                    "  Representative (user): {}...", lambda rr=representative_response: rr[:80]
+                )
                 
                 try:
-                    await coach.ensure_started()
-                    eval_res = await coach.evaluate_turn(
-                        conv_state,
-                        customer_prompt=customer_prompt,
-                        representative_response=representative_response,
-                    )
+                    eval_res = await coach_batcher.submit(customer_prompt, representative_response)
                     if eval_res and eval_res.parsed:
                         session_logger.append_coach_turn(
-                            conv_state.turn_index,
+                            eval_res.turn_number,
                             customer_prompt,
                             representative_response,
                             eval_res.parsed,
                         )
-                        logger.info(f"[COACH] Final turn {conv_state.turn_index} evaluation saved")
+                        logger.info(f"[COACH] Final turn {eval_res.turn_number} evaluation saved")
                 except Exception as e:
                     logger.error(f"[COACH] Final evaluation error: {e}", exc_info=True)
+            # Make sure every in-flight turn is scored and saved before the session assessment
+            await asyncio.gather(*coach_tasks, return_exceptions=True)
+            logger.info(f"[COACH] {len(conv_state.evaluations)} turns evaluated this session")
             
             # Write transcript snapshot
             tpath = session_logger.snapshot_transcript()
@@ -335,10 +516,12 @@ async def run_bot(transport: BaseTransport, scenario: str):
     try:
         await runner.run(task)
     finally:
+        await coach_batcher.aclose()
         try:
             await coach.stop()
         except Exception:
             pass
+        await session_logger.aclose()
 
 
 async def bot(runner_args: RunnerArguments):
@@ -356,7 +539,7 @@ async def bot(runner_args: RunnerArguments):
         webrtc_connection=runner_args.webrtc_connection,
     )
 
-    await run_bot(transport, scenario)
+    await run_bot(transport, scenario, CFG)
 
 
 if __name__ == "__main__":
@@ -405,17 +588,13 @@ if __name__ == "__main__":
     os.environ["SCENARIO"] = scenario
 
     # Validate required envs before starting
-    missing = [k for k in REQUIRED_ENV_KEYS if not os.environ.get(k)]
-    if missing:
-        missing_list = ", ".join(missing)
-        logger.error(f"Missing required environment variables: {missing_list}")
-        raise SystemExit(2)
+    CFG.validate()
 
     # Load and confirm scenario/persona at boot
     try:
-        _repo = PromptsRepository()
-        _info = _repo.scenario_info(scenario)
-        _system_head = _repo.persona_system_prompt_for_scenario(scenario)[:160].replace("\n", " ")
+        # Both lookups are precomputed on the shared repository, so run_bot reuses them
+        _info = _prompts().scenario_info(scenario)
+        _system_head = _prompts().persona_system_prompt_for_scenario(scenario)[:160].translate(_NL_TABLE)
         logger.info(
             f"Scenario confirmed: {scenario} | Persona: {_info.get('persona')} | Brief: {_info.get('brief')}"
         )
@@ -1,14 +1,22 @@
 import asyncio
-import json
+import bisect
+import contextlib
+import copy
+import functools
 import os
+import re
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 import google.generativeai as genai
+import orjson
+from google.api_core import exceptions as google_exceptions
 from loguru import logger
 from dotenv import load_dotenv
 
-from prompts_loader import PromptsRepository
+from prompts_loader import Prompt, PromptsRepository
 
 # Load .env specifically from the server directory to ensure keys are available
 _ENV_PATH = os.path.join(os.path.dirname(__file__), ".env")
@@ -23,32 +31,349 @@ if os.environ.get("ENABLE_TRACING"):
     except Exception as e:
         logger.warning(f"[COACH] Failed to enable Google GenAI instrumentation: {e}")
 
+
+# JSON object wrapped in a ```json fenced block
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+# Everything from the first '{' to the last '}'
+_JSON_BODY_RE = re.compile(r"\{.*\}", re.S)
+
+
+# Exact-match cache of parsed turn evaluations, shared across sessions. Keyed by every
+# input of the single-turn prompt: (scenario, persona_name, turn_number,
+# customer_prompt, representative_response). Batch results are not stored, since
+# each turn in a batch was scored alongside its neighbours. Entries are copied in
+# and out so no caller can mutate another session's evaluation.
+_EVAL_CACHE_SIZE = 256
+_EvalCacheKey = Tuple[str, str, int, str, str]
+_eval_cache: "OrderedDict[_EvalCacheKey, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+
+
+def _eval_cache_get(key: _EvalCacheKey) -> Optional[Tuple[str, Dict[str, Any]]]:
+    hit = _eval_cache.get(key)
+    if hit is None:
+        return None
+    _eval_cache.move_to_end(key)
+    raw_text, parsed = hit
+    return raw_text, copy.deepcopy(parsed)
+
+
+def _eval_cache_put(key: _EvalCacheKey, raw_text: str, parsed: Dict[str, Any]) -> None:
+    _eval_cache[key] = (raw_text, copy.deepcopy(parsed))
+    _eval_cache.move_to_end(key)
+    if len(_eval_cache) > _EVAL_CACHE_SIZE:
+        _eval_cache.popitem(last=False)
+
+
+# Turn evaluation prompt templates. The text starts at column 0 because any
+# indentation here is sent to Gemini verbatim as prompt tokens.
+_STATIC_CONTEXT_TEMPLATE = "{coach_system}\n\n{scenario_context}"
+
+_COACH_SYSTEM_TEMPLATE = """{system}
+
+**Your Role & Expertise:**
+{role_expertise}
+
+**Evaluation Criteria:**
+{eval_criteria}
+
+**Behavioral Guidelines:**
+{guidelines}
+
+**Coaching Philosophy:**
+{philosophy}"""
+
+_SCENARIO_CONTEXT_TEMPLATE = """**Current Scenario Context:**
+CUSTOMER PERSONA: {persona_name}
+SCENARIO: {scenario}
+EMOTIONAL STATE: {emotional_state}
+CUSTOMER BACKSTORY: {backstory}
+KEY CUSTOMER CONCERNS: {key_phrases}"""
+
+_SCENARIO_CONTEXT_MINIMAL_TEMPLATE = """**Current Scenario Context:**
+CUSTOMER PERSONA: {persona_name}
+SCENARIO: {scenario}"""
+
+_TURN_PROMPT_TEMPLATE = """Evaluate this single turn in the customer service conversation.
+Analyze how well the bank representative handled the customer's message.
+Focus on the representative's response quality, empathy, and problem-solving.
+Provide ONLY the JSON object, no additional text or markdown.
+
+**Turn Details:**
+- Turn Number: {turn_number}
+- Customer Statement: "{customer_prompt}"
+- Representative Response: "{representative_response}"
+
+**Required JSON Output:**
+{{
+"turn_quality_score": <0-10>,
+"immediate_strengths": ["specific strength observed"],
+"immediate_concerns": ["specific concern to address"],
+"next_turn_guidance": "specific suggestion for what to do next",
+"compliance_check": "pass/warning/fail with brief reason",
+"urgency_level": "low/medium/high - based on customer emotional state"
+}}"""
+
+_BATCH_INSTRUCTION = """Evaluate each of the following turns in the customer service conversation independently.
+For each turn, analyze how well the bank representative handled the customer's message.
+Focus on the representative's response quality, empathy, and problem-solving.
+Provide ONLY the JSON object, with one entry per turn in the given order, no additional text or markdown."""
+
+_BATCH_SCHEMA = """{
+"evaluations": [
+{
+"turn_number": <turn number>,
+"turn_quality_score": <0-10>,
+"immediate_strengths": ["specific strength observed"],
+"immediate_concerns": ["specific concern to address"],
+"next_turn_guidance": "specific suggestion for what to do next",
+"compliance_check": "pass/warning/fail with brief reason",
+"urgency_level": "low/medium/high - based on customer emotional state"
+}
+]
+}"""
+
+_SUMMARY_INSTRUCTION = """Analyze the complete customer service conversation and provide comprehensive feedback.
+Provide ONLY the JSON object per the schema, no additional text."""
+
+_SUMMARY_SCHEMA = """{
+"overall_performance_score": <0-10>,
+"category_scores": {
+"greeting_verification": <0-10>,
+"clarity": <0-10>,
+"empathy": <0-10>,
+"probing": <0-10>,
+"resolution_focus": <0-10>,
+"compliance": <0-10>
+},
+"key_strengths": ["specific strength with evidence"],
+"priority_improvements": ["specific area needing work"],
+"coaching_recommendations": ["specific training area"]
+}"""
+
+_SUMMARY_PROMPT_TEMPLATE = """{coach_system}
+
+{instruction}
+
+**Full Transcript:**
+{transcript}
+
+**Required JSON Output:**
+{schema}"""
+
+_ASSESSMENT_PROMPT_TEMPLATE = """You are an expert customer service coach providing detailed session assessments.
+{instruction}
+
+Available achievements to award (be selective, only award if truly earned):
+{achievements}
+
+Generate a markdown assessment with:
+1. Overall performance score (0-10)
+2. Category scores for each evaluation area
+3. Specific strengths with quoted evidence
+4. Areas for improvement with specific examples
+5. Actionable training recommendations
+6. Achievements earned (if any)
+
+IMPORTANT: Quote specific utterances from the representative as evidence.
+Format quotes like: "As shown in Turn 3: 'I understand this must be frustrating...'"
+
+**Session Details:**
+- Customer: {persona_name}
+- Scenario: {scenario}
+- Total Turns: {total_turns}
+
+**Full Conversation Transcript:**
+{conversation_text}
+
+Generate the markdown assessment now. Be specific and quote evidence."""
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_model(model_name: str, api_key: str):
+    """Return a process-wide GenerativeModel for the given model name and key.
+
+    genai.configure() drops the SDK's cached API clients, so calling it per coach
+    forces every session to open fresh connections. Configuring once and sharing
+    the model lets all coaches reuse the same kept-alive transport.
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+# Optional requests-per-minute cap for the Gemini API key, shared by every session in
+# the process (e.g. 15 for the free flash tier). Unset or 0 disables it.
+_MAX_RPM = int(os.environ.get("GEMINI_MAX_RPM", "0"))
+
+
+class RateLimiter:
+    """Sliding-window requests-per-minute limiter shared by all coaches."""
+
+    def __init__(self, max_rpm: int, window: float = 60.0):
+        self._max_rpm = max_rpm
+        self._window = window
+        self._stamps: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def wait_if_throttled(self) -> None:
+        """Block until a request fits in the current window, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._stamps and now - self._stamps[0] >= self._window:
+                    self._stamps.popleft()
+                if len(self._stamps) < self._max_rpm:
+                    self._stamps.append(now)
+                    return
+                delay = self._window - (now - self._stamps[0])
+                logger.debug(f"[COACH] RPM limit reached, waiting {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+
+# Optional cap on concurrent Gemini requests across all sessions in the process. The
+# cap is halved on overload (429, deadline exceeded, timeout) and recovers as requests
+# succeed. Unset or 0 disables it.
+_MAX_CONCURRENCY = int(os.environ.get("GEMINI_MAX_CONCURRENCY", "0"))
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on concurrent Gemini requests, driven by overload signals.
+
+    The limit grows by `alpha` after each request that completes and is multiplied
+    by `beta` after a timeout, a deadline error or a quota error (429). Latency alone
+    is not treated as overload: request budgets range from a single turn evaluation
+    to a 1500-token session assessment.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: float = 1.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+    ):
+        self._limit = float(maximum)
+        self._minimum = minimum
+        self._maximum = float(maximum)
+        self._alpha = alpha
+        self._beta = beta
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        while self._active >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done():
+                    # Pass the wake-up on to the next waiter
+                    self._wake()
+                raise
+        self._active += 1
+
+    def release(self, overloaded: bool = False) -> None:
+        self._active -= 1
+        if overloaded:
+            self._limit = max(self._minimum, self._limit * self._beta)
+        else:
+            self._limit = min(self._maximum, self._limit + self._alpha)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self._active
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+_rate_limiter: Optional[RateLimiter] = RateLimiter(_MAX_RPM) if _MAX_RPM > 0 else None
+_concurrency: Optional[AdaptiveConcurrency] = (
+    AdaptiveConcurrency(_MAX_CONCURRENCY) if _MAX_CONCURRENCY > 0 else None
+)
+
+
 def _safe_json_extract(text: str) -> Optional[Dict[str, Any]]:
     """Attempt to extract the first valid JSON object from text.
 
-    The model may return code fences or trailing commentary. This function tries to
-    find the first '{' and the last '}' and parse the substring. Returns None on
-    failure.
+    The model may return code fences or trailing commentary. This function tries the
+    whole text, then a fenced ```json block, and finally the substring between the
+    first '{' and the last '}'. Returns None on failure.
     """
     if not text:
         return None
     try:
         # Fast path
-        return json.loads(text)
+        return orjson.loads(text)
     except Exception:
         pass
-    try:
-        start = text.find("{")
-        end = text.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            frag = text[start : end + 1]
-            return json.loads(frag)
-    except Exception:
-        return None
+    match = _JSON_FENCE_RE.search(text)
+    if match:
+        try:
+            return orjson.loads(match.group(1))
+        except Exception:
+            pass
+    match = _JSON_BODY_RE.search(text)
+    if match:
+        try:
+            return orjson.loads(match.group(0))
+        except Exception:
+            return None
     return None
 
 
-@dataclass
+def _token_usage(response: Any) -> str:
+    """Format a response's token counts for debug logging."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return "unavailable"
+    prompt, completion = usage.prompt_token_count, usage.candidates_token_count
+    return f"prompt: {prompt}, completion: {completion}, total: {prompt + completion}"
+
+
+class _BraceScanner:
+    """Tracks the brace depth of streamed text, ignoring braces inside JSON strings.
+
+    Lets a stream consumer try to parse only once a top-level object has closed,
+    instead of re-parsing the whole buffer on every chunk containing '}'.
+    """
+
+    __slots__ = ("_depth", "_in_string", "_escaped")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk; return True if a top-level object closed within it."""
+        closed = False
+        for ch in text:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                # Quotes in prose around the object do not start a JSON string
+                self._in_string = self._depth > 0
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}" and self._depth > 0:
+                self._depth -= 1
+                closed = closed or self._depth == 0
+        return closed
+
+
+@dataclass(frozen=True, slots=True)
 class TurnEvaluation:
     turn_number: int
     customer_message: str
@@ -57,7 +382,7 @@ class TurnEvaluation:
     parsed: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationState:
     scenario: str
     persona_name: str
@@ -65,6 +390,16 @@ class ConversationState:
     last_evaluated_rep_response: Optional[str] = None
     turn_index: int = 0
     evaluations: List[TurnEvaluation] = field(default_factory=list)
+    # Rendered coach rubric + persona block; constant for the whole conversation
+    static_context: Optional[str] = None
+
+    def add_evaluation(self, evaluation: TurnEvaluation) -> None:
+        """Record an evaluation, keeping the list in turn order.
+
+        Batches run concurrently and can finish out of order; the summary and session
+        assessment read this list as the conversation's timeline.
+        """
+        bisect.insort(self.evaluations, evaluation, key=lambda ev: ev.turn_number)
 
 
 class GeminiCoach:
@@ -78,21 +413,43 @@ class GeminiCoach:
     they just block the output and break the functionallity.
     """
 
-    def __init__(self, prompts_repo: PromptsRepository, model: str = "gemini-1.5-flash"):
+    def __init__(
+        self,
+        prompts_repo: PromptsRepository,
+        model: str = "gemini-1.5-flash",
+        api_key: Optional[str] = None,
+    ):
         self._prompts_repo = prompts_repo
         self._model_name = model
         self._model = None
-        self._api_key = os.environ.get("GEMINI_API_KEY")
+        self._api_key = api_key or os.environ.get("GEMINI_API_KEY")
+        # Prompt records used on the hot path, resolved once in start()
+        self._coach_main: Optional[Prompt] = None
+        self._session_assessment: Optional[Prompt] = None
+        self._persona_by_scenario: Dict[str, Prompt] = {}
+        self._coach_system_block: Optional[str] = None
         
     async def start(self) -> None:
         """Initialize the Gemini model."""
         if not self._api_key:
             raise RuntimeError("GEMINI_API_KEY is not set")
-        
-        genai.configure(api_key=self._api_key)
-        self._model = genai.GenerativeModel(self._model_name)
+
+        self._resolve_prompts()
+        self._model = _shared_model(self._model_name, self._api_key)
         logger.info(f"[COACH] Initialized Gemini model: {self._model_name}")
 
+    def _resolve_prompts(self) -> None:
+        """Look up the prompt records the coach needs so turns don't scan the repo."""
+        coach_main = self._prompts_repo.find(entity="coach_agent", name_contains="Main System")
+        self._coach_main = coach_main[0] if coach_main else None
+        assessment = self._prompts_repo.find(entity="coach_agent", name_contains="Session Assessment")
+        self._session_assessment = assessment[0] if assessment else None
+        self._persona_by_scenario = {}
+        self._coach_system_block = None
+        for p in self._prompts_repo.find(entity="simulation_customer"):
+            if p.scenario:
+                self._persona_by_scenario.setdefault(p.scenario, p)
+
     def is_ready(self) -> bool:
         return self._model is not None
 
@@ -105,98 +462,103 @@ class GeminiCoach:
         self._model = None
         logger.info("[COACH] Coach stopped")
 
-    def _build_evaluation_prompt(
-        self,
-        state: ConversationState,
-        customer_prompt: str,
-        representative_response: str
-    ) -> str:
-        """Build the complete prompt for turn evaluation with full context.
-        
-        Args:
-            customer_prompt: What the customer (assistant bot) said
-            representative_response: How the bank rep (human user) responded
+    def _build_static_context(self, state: ConversationState) -> str:
+        """Return the static part of the evaluation prompt (coach rubric + persona).
+
+        This block does not change within a conversation, so it is rendered once and
+        kept on the state.
         """
-        
+        if state.static_context is None:
+            state.static_context = self._render_static_context(state)
+        return state.static_context
+
+    def _render_static_context(self, state: ConversationState) -> str:
+        if self._coach_system_block is None:
+            self._coach_system_block = self._render_coach_system()
+        return _STATIC_CONTEXT_TEMPLATE.format(
+            coach_system=self._coach_system_block,
+            scenario_context=self._render_scenario_context(state.scenario, state.persona_name),
+        )
+
+    def _render_coach_system(self) -> str:
+        """Formatted coach system block; identical for every conversation."""
         # Get the coach system prompt from prompts.json
-        coach_prompt = self._prompts_repo.find(entity="coach_agent", name_contains="Main System")
+        coach_prompt = self._coach_main
         if not coach_prompt:
             # Fallback to basic prompt
             coach_system = self._prompts_repo.coach_main_system_prompt()
         else:
-            coach_system = coach_prompt[0].content.get("system", "")
-            role_expertise = "\n".join(coach_prompt[0].content.get("role_expertise", []))
-            eval_criteria = "\n".join([f"- {c}" for c in coach_prompt[0].content.get("evaluation_criteria", [])])
-            guidelines = "\n".join([f"- {g}" for g in coach_prompt[0].content.get("behavioral_guidelines", [])])
-            philosophy = "\n".join([f"- {p}" for p in coach_prompt[0].content.get("coaching_philosophy", [])])
-            
-            coach_system = f"""{coach_system}
+            content = coach_prompt.content
+            coach_system = _COACH_SYSTEM_TEMPLATE.format(
+                system=content.get("system", ""),
+                role_expertise="\n".join(content.get("role_expertise", [])),
+                eval_criteria="\n".join([f"- {c}" for c in content.get("evaluation_criteria", [])]),
+                guidelines="\n".join([f"- {g}" for g in content.get("behavioral_guidelines", [])]),
+                philosophy="\n".join([f"- {p}" for p in content.get("coaching_philosophy", [])]),
+            )
+        return coach_system
 
-                        **Your Role & Expertise:**
-                        {role_expertise}
+    def _render_scenario_context(self, scenario: str, persona_name: str) -> str:
+        """Formatted scenario/persona context block for a conversation."""
+        # Get persona information for context
+        persona_prompt = self._persona_by_scenario.get(scenario)
+        if persona_prompt:
+            persona_info = persona_prompt.content
+            return _SCENARIO_CONTEXT_TEMPLATE.format(
+                persona_name=persona_name,
+                scenario=scenario,
+                emotional_state=persona_info.get("emotional_state", "Unknown"),
+                backstory="; ".join(persona_info.get("backstory", [])[:2]),
+                key_phrases="; ".join(persona_info.get("key_phrases", [])[:2]),
+            )
+        return _SCENARIO_CONTEXT_MINIMAL_TEMPLATE.format(
+            persona_name=persona_name, scenario=scenario
+        )
 
-                        **Evaluation Criteria:**
-                        {eval_criteria}
+    def _build_turn_prompt(
+        self,
+        state: ConversationState,
+        customer_prompt: str,
+        representative_response: str,
+        turn_number: Optional[int] = None,
+    ) -> str:
+        """Build the per-turn part of the evaluation prompt.
 
-                        **Behavioral Guidelines:**
-                        {guidelines}
+        Args:
+            customer_prompt: What the customer (assistant bot) said
+            representative_response: How the bank rep (human user) responded
+            turn_number: Number of the turn; defaults to the state's current turn
+        """
+        if turn_number is None:
+            turn_number = state.turn_index
+        return _TURN_PROMPT_TEMPLATE.format(
+            turn_number=turn_number,
+            customer_prompt=customer_prompt,
+            representative_response=representative_response,
+        )
 
-                        **Coaching Philosophy:**
-                        {philosophy}"""
+    def _build_evaluation_prompt(
+        self,
+        state: ConversationState,
+        customer_prompt: str,
+        representative_response: str,
+        turn_number: Optional[int] = None,
+    ) -> List[str]:
+        """Build the complete prompt parts for turn evaluation with full context.
 
-        # Get persona information for context
-        persona_prompts = self._prompts_repo.find(entity="simulation_customer", scenario=state.scenario)
-        if persona_prompts:
-            persona_info = persona_prompts[0].content
-            emotional_state = persona_info.get("emotional_state", "Unknown")
-            key_phrases = persona_info.get("key_phrases", [])
-            backstory = persona_info.get("backstory", [])
-            
-            scenario_context = f"""
-                            **Current Scenario Context:**
-                            CUSTOMER PERSONA: {state.persona_name}
-                            SCENARIO: {state.scenario}
-                            EMOTIONAL STATE: {emotional_state}
-                            CUSTOMER BACKSTORY: {'; '.join(backstory[:2])}
-                            KEY CUSTOMER CONCERNS: {'; '.join(key_phrases[:2])}
-                            """
-        else:
-            scenario_context = f"""
-            **Current Scenario Context:**
-            CUSTOMER PERSONA: {state.persona_name}
-            SCENARIO: {state.scenario}
-            """
-
-        # Build the complete prompt
-        instruction = """Evaluate this single turn in the customer service conversation. 
-            Analyze how well the bank representative handled the customer's message.
-            Focus on the representative's response quality, empathy, and problem-solving.
-            Provide ONLY the JSON object, no additional text or markdown."""
-
-        turn_context = f"""
-                        **Turn Details:**
-                        - Turn Number: {state.turn_index}
-                        - Customer Statement: "{customer_prompt}"
-                        - Representative Response: "{representative_response}"
-
-                        **Required JSON Output:**
-                        {{
-                        "turn_quality_score": <0-10>,
-                        "immediate_strengths": ["specific strength observed"],
-                        "immediate_concerns": ["specific concern to address"],
-                        "next_turn_guidance": "specific suggestion for what to do next",
-                        "compliance_check": "pass/warning/fail with brief reason",
-                        "urgency_level": "low/medium/high - based on customer emotional state"
-                        }}
-                        """
-
-        return f"""{coach_system}
-
-                    {scenario_context}
-
-                    {instruction}
-
-                    {turn_context}"""
+        The pre-rendered static context and the per-turn details are sent as separate
+        parts, so only the small turn block is formatted per call.
+        
+        Args:
+            customer_prompt: What the customer (assistant bot) said
+            representative_response: How the bank rep (human user) responded
+        """
+        return [
+            self._build_static_context(state),
+            self._build_turn_prompt(
+                state, customer_prompt, representative_response, turn_number
+            ),
+        ]
 
     async def evaluate_turn(
         self,
@@ -221,11 +583,133 @@ class GeminiCoach:
         state.last_customer_message = customer_prompt
         state.last_evaluated_rep_response = representative_response
 
-        # Build the complete prompt
-        prompt = self._build_evaluation_prompt(state, customer_prompt, representative_response)
+        return await self._evaluate_numbered(
+            state, state.turn_index, customer_prompt, representative_response
+        )
+
+    @contextlib.asynccontextmanager
+    async def _gated(self, timeout: float):
+        """Hold the shared RPM limit and adaptive concurrency gate for one request.
+
+        Both gates are optional. Waiting on them counts against the request's timeout;
+        the context yields the time left for the request itself.
+        """
+        deadline = time.monotonic() + timeout
+        if _rate_limiter is not None:
+            await asyncio.wait_for(_rate_limiter.wait_if_throttled(), timeout=timeout)
+        if _concurrency is None:
+            yield deadline - time.monotonic()
+            return
+        await asyncio.wait_for(_concurrency.acquire(), timeout=deadline - time.monotonic())
+        overloaded = False
+        try:
+            yield deadline - time.monotonic()
+        except (
+            asyncio.TimeoutError,
+            google_exceptions.ResourceExhausted,
+            google_exceptions.DeadlineExceeded,
+        ):
+            overloaded = True
+            raise
+        finally:
+            _concurrency.release(overloaded)
+            if overloaded:
+                logger.warning(f"[COACH] Gemini overloaded, concurrency limit now {_concurrency.limit}")
+
+    async def _generate(self, model, prompt: Any, timeout: float, **kwargs: Any):
+        """Call Gemini under the shared RPM limit and adaptive concurrency gate."""
+        async with self._gated(timeout) as remaining:
+            return await asyncio.wait_for(
+                model.generate_content_async(prompt, **kwargs), timeout=remaining
+            )
+
+    async def _stream_json(
+        self, model, prompt: Any, timeout: float, **kwargs: Any
+    ) -> Tuple[str, Optional[Dict[str, Any]], Any]:
+        """Stream a JSON response and stop reading as soon as the object is complete.
+
+        The model often keeps generating whitespace or commentary after the closing
+        brace; parsing the buffer as chunks arrive lets the evaluation return without
+        waiting for the rest of the stream.
+
+        Returns:
+            (raw_text, parsed, usage_chunk); parsed is None if no complete object arrived,
+            usage_chunk is the last chunk that carried usage metadata (None if none did).
+        """
+        async def consume() -> Tuple[str, Optional[Dict[str, Any]], Any]:
+            response = await model.generate_content_async(prompt, stream=True, **kwargs)
+            chunks = response.__aiter__()
+            buffer: List[str] = []
+            scanner = _BraceScanner()
+            usage_chunk = None
+            try:
+                async for chunk in chunks:
+                    if getattr(chunk, "usage_metadata", None):
+                        usage_chunk = chunk
+                    try:
+                        text = self._response_text(chunk)
+                    except ValueError:
+                        # Chunk without text parts (e.g. finish reason only)
+                        continue
+                    if text == "Response blocked by safety filters":
+                        return text, None, usage_chunk
+                    buffer.append(text)
+                    if scanner.feed(text):
+                        raw_text = "".join(buffer)
+                        parsed = _safe_json_extract(raw_text)
+                        if parsed is not None:
+                            return raw_text, parsed, usage_chunk
+            finally:
+                # Returning early must not leave the response generator suspended until GC
+                with contextlib.suppress(Exception):
+                    await chunks.aclose()
+            raw_text = "".join(buffer)
+            return raw_text, _safe_json_extract(raw_text), usage_chunk
+
+        async with self._gated(timeout) as remaining:
+            return await asyncio.wait_for(consume(), timeout=remaining)
+
+    def _response_text(self, response) -> str:
+        """Return the response text, or a marker if it was blocked by safety filters."""
+        if response and response.candidates:
+            candidate = response.candidates[0]
+            if hasattr(candidate, 'finish_reason') and candidate.finish_reason == 2:  # SAFETY
+                logger.warning(f"[COACH] Response blocked by safety filters")
+                return "Response blocked by safety filters"
+            return response.text if response else ""
+        return ""
+
+    async def _evaluate_numbered(
+        self,
+        state: ConversationState,
+        turn_number: int,
+        customer_prompt: str,
+        representative_response: str,
+    ) -> TurnEvaluation:
+        """Evaluate a single turn that has already been debounced and numbered."""
+        cache_key = (
+            state.scenario, state.persona_name, turn_number, customer_prompt, representative_response
+        )
+        cached = _eval_cache_get(cache_key)
+        if cached is not None:
+            raw_text, parsed = cached
+            logger.info(f"[COACH] Turn {turn_number} evaluation (cached): score={parsed.get('turn_quality_score')}")
+            evaluation = TurnEvaluation(
+                turn_number=turn_number,
+                customer_message=customer_prompt,
+                representative_response=representative_response,
+                raw_text=raw_text,
+                parsed=parsed,
+            )
+            state.add_evaluation(evaluation)
+            return evaluation
+
+        prompt = self._build_evaluation_prompt(
+            state, customer_prompt, representative_response, turn_number
+        )
         
         logger.info(
-            f"[COACH] Evaluating turn {state.turn_index}: "
+            f"[COACH] Evaluating turn {turn_number}: "
             f"persona='{state.persona_name}', scenario='{state.scenario}'"
         )
         
@@ -233,145 +717,258 @@ class GeminiCoach:
 
         try:
             # Use async timeout for the API call with relaxed safety settings
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._model.generate_content,
-                    prompt,
-                    generation_config={
-                        "temperature": 0.3,
-                        "max_output_tokens": 500,
-                        "response_mime_type": "text/plain",
-                    },
-                    safety_settings={
-                        "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
-                        "HARM_CATEGORY_HATE_SPEECH": "BLOCK_NONE",
-                        "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
-                        "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
-                    }
-                ),
-                timeout=10.0
+            raw_text, parsed, usage_chunk = await self._stream_json(
+                self._model,
+                prompt,
+                timeout=10.0,
+                generation_config={
+                    "temperature": 0.3,
+                    "max_output_tokens": 500,
+                    "response_mime_type": "text/plain",
+                },
+                safety_settings={
+                    "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
+                    "HARM_CATEGORY_HATE_SPEECH": "BLOCK_NONE",
+                    "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
+                    "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
+                }
             )
             
-            # Check if response was blocked by safety filters
-            if response and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'finish_reason'):
-                    from google.generativeai.types import GenerationConfig
-                    if candidate.finish_reason == 2:  # SAFETY
-                        logger.warning(f"[COACH] Response blocked by safety filters")
-                        raw_text = "Response blocked by safety filters"
-                    else:
-                        raw_text = response.text if response else ""
-                else:
-                    raw_text = response.text if response else ""
-            else:
-                raw_text = ""
-            
             if raw_text and raw_text != "Response blocked by safety filters":
                 logger.debug(f"[COACH] Raw response: {raw_text[:200]}...")
             
-            parsed = _safe_json_extract(raw_text)
-            
             # Log token usage for debugging
-            if hasattr(response, 'usage_metadata'):
-                logger.debug(
-                    f"[COACH] Tokens - prompt: {response.usage_metadata.prompt_token_count}, "
-                    f"completion: {response.usage_metadata.candidates_token_count}, "
-                    f"total: {response.usage_metadata.prompt_token_count + response.usage_metadata.candidates_token_count}"
+            if usage_chunk is not None:
+                logger.opt(lazy=True).debug(
+                    "[COACH] Tokens - {}", lambda: _token_usage(usage_chunk)
                 )
             
             if parsed:
-                logger.info(f"[COACH] Turn {state.turn_index} evaluation: score={parsed.get('turn_quality_score')}")
+                logger.info(f"[COACH] Turn {turn_number} evaluation: score={parsed.get('turn_quality_score')}")
+                _eval_cache_put(cache_key, raw_text, parsed)
             else:
                 logger.warning(f"[COACH] Failed to parse JSON from response")
                 
         except asyncio.TimeoutError:
-            logger.error(f"[COACH] Evaluation timeout for turn {state.turn_index}")
+            logger.error(f"[COACH] Evaluation timeout for turn {turn_number}")
             raw_text = "Timeout"
             parsed = None
         except Exception as e:
-            logger.error(f"[COACH] Evaluation error for turn {state.turn_index}: {e}")
+            logger.error(f"[COACH] Evaluation error for turn {turn_number}: {e}")
             raw_text = str(e)
             parsed = None
 
         evaluation = TurnEvaluation(
-            turn_number=state.turn_index,
+            turn_number=turn_number,
             customer_message=customer_prompt,  # Keeping field name for compatibility
             representative_response=representative_response,
             raw_text=raw_text,
             parsed=parsed,
         )
-        state.evaluations.append(evaluation)
+        state.add_evaluation(evaluation)
         
         return evaluation
 
+    def _build_batch_prompt(self, turns: List[Tuple[int, str, str]]) -> str:
+        """Build the per-turn part of a multi-turn evaluation prompt.
+
+        Args:
+            turns: (turn_number, customer_prompt, representative_response) per turn
+        """
+        turn_blocks = "\n".join(
+            f"**Turn {number}:**\n"
+            f"- Customer Statement: \"{customer}\"\n"
+            f"- Representative Response: \"{rep}\"\n"
+            for number, customer, rep in turns
+        )
+
+        return f"""{_BATCH_INSTRUCTION}
+
+{turn_blocks}
+**Required JSON Output:**
+{_BATCH_SCHEMA}"""
+
+    async def evaluate_turns_batch(
+        self,
+        state: ConversationState,
+        turns: List[Tuple[str, str]],
+    ) -> List[Optional[TurnEvaluation]]:
+        """Evaluate several completed turns with a single Gemini request.
+
+        Args:
+            turns: (customer_prompt, representative_response) pairs in conversation order
+
+        Returns:
+            One entry per input turn; None for turns skipped as duplicates.
+        """
+        if len(turns) == 1:
+            return [await self.evaluate_turn(state, *turns[0])]
+
+        # Apply the same debounce as evaluate_turn and number the turns up front
+        numbered: List[Tuple[int, str, str]] = []
+        slots: List[Optional[int]] = []
+        for customer_prompt, representative_response in turns:
+            if (
+                state.last_evaluated_rep_response == representative_response
+                and state.last_customer_message == customer_prompt
+            ):
+                logger.debug("[COACH] Skipping duplicate evaluation")
+                slots.append(None)
+                continue
+            state.turn_index += 1
+            state.last_customer_message = customer_prompt
+            state.last_evaluated_rep_response = representative_response
+            slots.append(len(numbered))
+            numbered.append((state.turn_index, customer_prompt, representative_response))
+
+        if not numbered:
+            return [None] * len(turns)
+        if len(numbered) == 1:
+            # Duplicates collapsed the batch; numbering is already applied
+            return [
+                None if slot is None else await self._evaluate_numbered(state, *numbered[0])
+                for slot in slots
+            ]
+
+        # Turns already scored on their own (in any session) are served from the cache
+        by_number: Dict[int, Dict[str, Any]] = {}
+        raw_by_number: Dict[int, str] = {}
+        pending: List[Tuple[int, str, str]] = []
+        for number, customer_prompt, representative_response in numbered:
+            cached = _eval_cache_get(
+                (state.scenario, state.persona_name, number, customer_prompt, representative_response)
+            )
+            if cached is not None:
+                raw_by_number[number], by_number[number] = cached
+            else:
+                pending.append((number, customer_prompt, representative_response))
+
+        raw_text = ""
+        if pending:
+            raw_text = await self._request_batch(state, pending, by_number)
+
+        results: List[Optional[TurnEvaluation]] = []
+        for slot in slots:
+            if slot is None:
+                results.append(None)
+                continue
+            number, customer_prompt, representative_response = numbered[slot]
+            parsed_turn = by_number.get(number)
+            if parsed_turn:
+                logger.info(f"[COACH] Turn {number} evaluation: score={parsed_turn.get('turn_quality_score')}")
+            evaluation = TurnEvaluation(
+                turn_number=number,
+                customer_message=customer_prompt,
+                representative_response=representative_response,
+                raw_text=raw_by_number.get(number, raw_text),
+                parsed=parsed_turn,
+            )
+            state.add_evaluation(evaluation)
+            results.append(evaluation)
+        return results
+
+    async def _request_batch(
+        self,
+        state: ConversationState,
+        turns: List[Tuple[int, str, str]],
+        by_number: Dict[int, Dict[str, Any]],
+    ) -> str:
+        """Score numbered turns with one Gemini request.
+
+        Parsed per-turn results are stored into `by_number`.
+        Returns the raw response text, or the error text on failure.
+        """
+        prompt = [self._build_static_context(state), self._build_batch_prompt(turns)]
+        first, last = turns[0][0], turns[-1][0]
+
+        logger.info(
+            f"[COACH] Evaluating turns {first}-{last} in one request: "
+            f"persona='{state.persona_name}', scenario='{state.scenario}'"
+        )
+
+        try:
+            raw_text, parsed, _ = await self._stream_json(
+                self._model,
+                prompt,
+                timeout=10.0 * len(turns),
+                generation_config={
+                    "temperature": 0.3,
+                    "max_output_tokens": 500 * len(turns),
+                    "response_mime_type": "text/plain",
+                },
+                safety_settings={
+                    "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
+                    "HARM_CATEGORY_HATE_SPEECH": "BLOCK_NONE",
+                    "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
+                    "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
+                }
+            )
+            evaluations = (parsed or {}).get("evaluations") or []
+            turn_numbers = {number for number, _, _ in turns}
+            parsed_any = False
+            for position, item in enumerate(evaluations):
+                if not isinstance(item, dict):
+                    continue
+                number = item.get("turn_number")
+                if number not in turn_numbers and position < len(turns):
+                    number = turns[position][0]
+                if number not in turn_numbers:
+                    continue
+                by_number[number] = item
+                parsed_any = True
+            if not parsed_any:
+                logger.warning(f"[COACH] Failed to parse JSON from batch response")
+            return raw_text
+        except asyncio.TimeoutError:
+            logger.error(f"[COACH] Evaluation timeout for turns {first}-{last}")
+            return "Timeout"
+        except Exception as e:
+            logger.error(f"[COACH] Evaluation error for turns {first}-{last}: {e}")
+            return str(e)
+
     async def summarize_conversation(self, state: ConversationState) -> Optional[Dict[str, Any]]:
         """Generate end-to-end assessment of the complete conversation."""
         if not state.evaluations:
             return None
 
         # Get coach system prompt
-        coach_prompt = self._prompts_repo.find(entity="coach_agent", name_contains="Main System")
+        coach_prompt = self._coach_main
         if coach_prompt:
-            coach_system = coach_prompt[0].content.get("system", "")
+            coach_system = coach_prompt.content.get("system", "")
         else:
             coach_system = self._prompts_repo.coach_main_system_prompt()
 
-        instruction = """Analyze the complete customer service conversation and provide comprehensive feedback.
-                        Provide ONLY the JSON object per the schema, no additional text."""
-
-        # Build transcript text
-        lines: List[str] = []
-        for ev in state.evaluations:
-            lines.append(f"Turn {ev.turn_number} - Customer: {ev.customer_message}")
-            lines.append(f"Turn {ev.turn_number} - Representative: {ev.representative_response}")
-        transcript_text = "\n".join(lines)
-
-        summary_schema = """
-                        {
-                        "overall_performance_score": <0-10>,
-                        "category_scores": {
-                            "greeting_verification": <0-10>,
-                            "clarity": <0-10>,
-                            "empathy": <0-10>,
-                            "probing": <0-10>,
-                            "resolution_focus": <0-10>,
-                            "compliance": <0-10>
-                        },
-                        "key_strengths": ["specific strength with evidence"],
-                        "priority_improvements": ["specific area needing work"],
-                        "coaching_recommendations": ["specific training area"]
-                        }"""
-
-        prompt = f"""{coach_system}
-
-                    {instruction}
-
-                    **Full Transcript:**
-                    {transcript_text}
-
-                    **Required JSON Output:**
-                    {summary_schema}"""
+        # Build transcript text (one pre-formatted two-line block per turn)
+        transcript_text = "\n".join(
+            f"Turn {ev.turn_number} - Customer: {ev.customer_message}\n"
+            f"Turn {ev.turn_number} - Representative: {ev.representative_response}"
+            for ev in state.evaluations
+        )
+
+        prompt = _SUMMARY_PROMPT_TEMPLATE.format(
+            coach_system=coach_system,
+            instruction=_SUMMARY_INSTRUCTION,
+            transcript=transcript_text,
+            schema=_SUMMARY_SCHEMA,
+        )
         
         # Automatic tracing via GoogleGenAIInstrumentor handles this
 
         try:
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._model.generate_content,
-                    prompt,
-                    generation_config={
-                        "temperature": 0.3,
-                        "max_output_tokens": 800,
-                    },
-                    safety_settings={
-                        "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
-                        "HARM_CATEGORY_HATE_SPEECH": "BLOCK_NONE",
-                        "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
-                        "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
-                    }
-                ),
-                timeout=15.0
+            response = await self._generate(
+                self._model,
+                prompt,
+                timeout=15.0,
+                generation_config={
+                    "temperature": 0.3,
+                    "max_output_tokens": 800,
+                },
+                safety_settings={
+                    "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
+                    "HARM_CATEGORY_HATE_SPEECH": "BLOCK_NONE",
+                    "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
+                    "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
+                }
             )
             
             # Check if response was blocked by safety filters
@@ -389,12 +986,9 @@ class GeminiCoach:
                 parsed = None
             
             # Log token usage for debugging
-            if hasattr(response, 'usage_metadata'):
-                logger.debug(
-                    f"[COACH] Summary tokens - prompt: {response.usage_metadata.prompt_token_count}, "
-                    f"completion: {response.usage_metadata.candidates_token_count}, "
-                    f"total: {response.usage_metadata.prompt_token_count + response.usage_metadata.candidates_token_count}"
-                )
+            logger.opt(lazy=True).debug(
+                "[COACH] Summary tokens - {}", lambda: _token_usage(response)
+            )
             
             logger.info(f"[COACH][SUMMARY] Generated summary evaluation")
             return parsed
@@ -413,76 +1007,49 @@ class GeminiCoach:
             return "# Session Assessment\n\nNo transcript available for assessment."
         
         # Get assessment prompt
-        assessment_prompt = self._prompts_repo.find(entity="coach_agent", name_contains="Session Assessment")
+        assessment_prompt = self._session_assessment
         if not assessment_prompt:
             logger.error("[COACH] Session assessment prompt not found")
             return "# Session Assessment\n\nAssessment configuration not found."
         
-        prompt_content = assessment_prompt[0].content
+        prompt_content = assessment_prompt.content
         instruction = prompt_content.get("instruction", "")
         achievements_list = prompt_content.get("achievements", [])
         
-        # Build conversation text with evidence markers
-        conversation_lines = []
-        for i, entry in enumerate(transcript, 1):
-            role = entry.get("role", "").title()
-            content = entry.get("content", "")
-            timestamp = entry.get("ts", "")
-            conversation_lines.append(f"[Turn {i} - {timestamp}]")
-            conversation_lines.append(f"{role}: {content}")
-            conversation_lines.append("")
-        
-        conversation_text = "\n".join(conversation_lines)
+        # Build conversation text with evidence markers (one block per entry,
+        # separated by a blank line)
+        conversation_text = "\n".join(
+            f"[Turn {i} - {entry.get('ts', '')}]\n"
+            f"{entry.get('role', '').title()}: {entry.get('content', '')}\n"
+            for i, entry in enumerate(transcript, 1)
+        )
         
         # Build the assessment prompt
-        system_prompt = f"""You are an expert customer service coach providing detailed session assessments.
-        {instruction}
-        
-        Available achievements to award (be selective, only award if truly earned):
-        {chr(10).join(achievements_list)}
-        
-        Generate a markdown assessment with:
-        1. Overall performance score (0-10)
-        2. Category scores for each evaluation area
-        3. Specific strengths with quoted evidence
-        4. Areas for improvement with specific examples
-        5. Actionable training recommendations
-        6. Achievements earned (if any)
-        
-        IMPORTANT: Quote specific utterances from the representative as evidence.
-        Format quotes like: "As shown in Turn 3: 'I understand this must be frustrating...'"
-        """
-        
-        assessment_prompt_text = f"""{system_prompt}
-        
-        **Session Details:**
-        - Customer: {state.persona_name}
-        - Scenario: {state.scenario}
-        - Total Turns: {len(transcript)}
-        
-        **Full Conversation Transcript:**
-        {conversation_text}
-        
-        Generate the markdown assessment now. Be specific and quote evidence."""
+        assessment_prompt_text = _ASSESSMENT_PROMPT_TEMPLATE.format(
+            instruction=instruction,
+            achievements="\n".join(achievements_list),
+            persona_name=state.persona_name,
+            scenario=state.scenario,
+            total_turns=len(transcript),
+            conversation_text=conversation_text,
+        )
         
         try:
-            response = await asyncio.wait_for(
-                asyncio.to_thread(
-                    self._model.generate_content,
-                    assessment_prompt_text,
-                    generation_config={
-                        "temperature": 0.4,
-                        "max_output_tokens": 1500,
-                        "response_mime_type": "text/plain",
-                    },
-                    safety_settings={
-                        "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
-                        "HARM_CATEGORY_HATE_SPEECH": "BLOCK_NONE",
-                        "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
-                        "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
-                    }
-                ),
-                timeout=20.0
+            response = await self._generate(
+                self._model,
+                assessment_prompt_text,
+                timeout=20.0,
+                generation_config={
+                    "temperature": 0.4,
+                    "max_output_tokens": 1500,
+                    "response_mime_type": "text/plain",
+                },
+                safety_settings={
+                    "HARM_CATEGORY_HARASSMENT": "BLOCK_NONE",
+                    "HARM_CATEGORY_HATE_SPEECH": "BLOCK_NONE",
+                    "HARM_CATEGORY_SEXUALLY_EXPLICIT": "BLOCK_NONE",
+                    "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_NONE",
+                }
             )
             
             if response and response.text:
@@ -500,6 +1067,95 @@ class GeminiCoach:
             return f"# Session Assessment\n\nAssessment generation failed: {str(e)}"
 
 
+class CoachBatcher:
+    """Coalesces completed turns into batched coach evaluations.
+
+    Turns submitted within `window` seconds of each other (up to `max_batch`) are
+    scored together with one Gemini request via `GeminiCoach.evaluate_turns_batch`,
+    sharing a single round-trip and prefill of the coach rubric. Up to
+    `max_in_flight` batches are evaluated concurrently, so a slow request does not
+    hold back the turns queued behind it.
+    """
+
+    def __init__(
+        self,
+        coach: GeminiCoach,
+        state: ConversationState,
+        window: float = 0.5,
+        max_batch: int = 4,
+        max_in_flight: int = 4,
+    ):
+        self._coach = coach
+        self._state = state
+        self._window = window
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._requests: Set[asyncio.Task] = set()
+
+    def submit_nowait(
+        self, customer_prompt: str, representative_response: str
+    ) -> "asyncio.Future[Optional[TurnEvaluation]]":
+        """Queue a turn for evaluation and return a future for its result.
+
+        Callers that don't need the evaluation can drop the future; the turn is
+        still scored and recorded on the conversation state.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((customer_prompt, representative_response, future))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def submit(
+        self, customer_prompt: str, representative_response: str
+    ) -> Optional[TurnEvaluation]:
+        """Queue a turn for evaluation and wait for its result."""
+        return await self.submit_nowait(customer_prompt, representative_response)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=self._window))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._in_flight.acquire()
+            request = asyncio.create_task(self._evaluate(batch))
+            self._requests.add(request)
+            request.add_done_callback(self._requests.discard)
+
+    async def _evaluate(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        try:
+            await self._coach.ensure_started()
+            results = await self._coach.evaluate_turns_batch(
+                self._state, [(customer, rep) for customer, rep, _ in batch]
+            )
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._in_flight.release()
+
+    async def aclose(self) -> None:
+        """Stop the background batching task and any in-flight requests."""
+        tasks = list(self._requests)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._requests.clear()
+
+
 if __name__ == "__main__":
     # Minimal self-test: send a single synthetic turn and print parsed JSON
     import asyncio as _asyncio
@@ -13,12 +13,28 @@ conversational context for coach evaluation.
 The coach evaluates how well the USER (bank rep) handles the ASSISTANT (customer).
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Deque, Iterator, List, Optional
 from loguru import logger
 
 
-@dataclass
+def _aggregate(fragments: List[str]) -> str:
+    """Join response fragments into one message with normalized whitespace."""
+    parts: List[str] = []
+    for fragment in fragments:
+        parts.extend(fragment.split())
+    return " ".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
+class TurnPair:
+    """A completed turn ready for coach evaluation."""
+    customer: str  # What the customer (assistant) said
+    rep: str  # Aggregated bank rep (user) response
+
+
+@dataclass(slots=True)
 class ConversationTurn:
     """Represents a complete conversation turn for coach evaluation.
     
@@ -31,13 +47,7 @@ class ConversationTurn:
     
     def get_aggregated_representative_response(self) -> str:
         """Combine all representative response fragments into one coherent message."""
-        if not self.representative_responses:
-            return ""
-        # Join with space, but clean up any double spaces
-        aggregated = " ".join(self.representative_responses)
-        # Clean up any redundant spaces
-        aggregated = " ".join(aggregated.split())
-        return aggregated
+        return _aggregate(self.representative_responses)
     
     def is_complete(self) -> bool:
         """Check if turn has both customer prompt and representative response."""
@@ -59,15 +69,31 @@ class ConversationAggregator:
         Deepgram fragments: ["Okay.", "I understand.", "When did you first notice the issue?"]
         Aggregator pairs: Customer prompt + aggregated rep response for evaluation
     """
+
+    __slots__ = (
+        "pending_customer_prompt",
+        "pending_rep_fragments",
+        "completed_turns",
+        "_turn_count",
+        "_pending_rep_tokens",
+    )
     
-    def __init__(self):
-        """Initialize the aggregator with empty state."""
+    def __init__(self, history_limit: int = 64):
+        """Initialize the aggregator with empty state.
+
+        Args:
+            history_limit: Number of most recent completed turns kept for
+                get_last_complete_turn() and the debug summary
+        """
         self.pending_customer_prompt: Optional[str] = None  # Current customer (assistant) message
         self.pending_rep_fragments: List[str] = []  # Accumulating bank rep (user) responses
-        self.completed_turns: List[ConversationTurn] = []
+        self.completed_turns: Deque[ConversationTurn] = deque(maxlen=history_limit)
         self._turn_count = 0
+        # Whitespace-split tokens of pending_rep_fragments, kept up to date as
+        # fragments arrive so closing a turn is a single join
+        self._pending_rep_tokens: List[str] = []
         
-    def add_message(self, role: str, content: str) -> Optional[Tuple[str, str]]:
+    def add_message(self, role: str, content: str) -> Optional[TurnPair]:
         """
         Add a message to the conversation flow.
         
@@ -76,20 +102,24 @@ class ConversationAggregator:
             content: The message content
             
         Returns:
-            Optional tuple of (customer_prompt, representative_response)
+            A TurnPair (customer prompt, aggregated representative response)
             when a complete turn is ready for coach evaluation.
             Returns None if turn is not yet complete.
         """
-        if not content or not content.strip():
-            logger.debug(f"[AGGREGATOR] Skipping empty {role} message")
+        # STT fragments usually arrive trimmed; only strip when an edge is whitespace
+        if content and (content[0].isspace() or content[-1].isspace()):
+            stripped = content.strip()
+        else:
+            stripped = content
+        if not stripped:
+            logger.debug("[AGGREGATOR] Skipping empty {} message", role)
             return None
             
         if role == "assistant":  # Customer (bot) speaking
             # Check if we have a pending turn to complete
             if self.pending_customer_prompt and self.pending_rep_fragments:
                 # Complete the previous turn before starting new one
-                aggregated_rep = " ".join(self.pending_rep_fragments)
-                aggregated_rep = " ".join(aggregated_rep.split())  # Clean spaces
+                aggregated_rep = " ".join(self._pending_rep_tokens)
                 
                 previous_prompt = self.pending_customer_prompt
                 self._turn_count += 1
@@ -97,48 +127,64 @@ class ConversationAggregator:
                 # Store completed turn
                 turn = ConversationTurn(
                     customer_prompt=previous_prompt,
-                    representative_responses=self.pending_rep_fragments.copy()
+                    representative_responses=self.pending_rep_fragments,
                 )
                 self.completed_turns.append(turn)
                 
-                logger.info(f"[AGGREGATOR] Complete turn #{self._turn_count} ready for evaluation:")
-                logger.info(f"  Customer (assistant): '{previous_prompt[:100]}...'")
-                logger.info(f"  Representative (user aggregated from {len(self.pending_rep_fragments)} parts): '{aggregated_rep[:100]}...'")
+                # Previews are sliced by the format spec, only when the record is emitted
+                logger.info(
+                    "[AGGREGATOR] Complete turn #{} ready for evaluation:\n"
+                    "  Customer (assistant): '{:.100}...'\n"
+                    "  Representative (user aggregated from {} parts): '{:.100}...'",
+                    self._turn_count,
+                    previous_prompt,
+                    len(self.pending_rep_fragments),
+                    aggregated_rep,
+                )
                 
                 # Reset for new turn
-                self.pending_customer_prompt = content.strip()
-                self.pending_rep_fragments = []
+                self.pending_customer_prompt = stripped
+                self.pending_rep_fragments = []  # The completed turn now owns the old list
+                self._pending_rep_tokens.clear()
                 
-                return (previous_prompt, aggregated_rep)
+                return TurnPair(previous_prompt, aggregated_rep)
             else:
                 # Starting new turn or initial greeting
-                logger.info(f"[AGGREGATOR] Customer (assistant) message starting turn: '{content[:50]}...'")
-                self.pending_customer_prompt = content.strip()
-                self.pending_rep_fragments = []
+                logger.info("[AGGREGATOR] Customer (assistant) message starting turn: '{:.50}...'", stripped)
+                self.pending_customer_prompt = stripped
+                self.pending_rep_fragments.clear()
+                self._pending_rep_tokens.clear()
                 return None
             
         elif role == "user":  # Bank representative (human) responding
             if not self.pending_customer_prompt:
-                logger.warning(f"[AGGREGATOR] Bank rep (user) response without customer prompt - ignoring: '{content[:50]}...'")
+                logger.warning(
+                    "[AGGREGATOR] Bank rep (user) response without customer prompt - ignoring: '{:.50}...'",
+                    stripped,
+                )
                 return None
                 
             # Accumulate bank rep's response fragments
-            self.pending_rep_fragments.append(content.strip())
-            logger.debug(f"[AGGREGATOR] Added bank rep (user) fragment #{len(self.pending_rep_fragments)}: '{content[:50]}...'")
+            self.pending_rep_fragments.append(stripped)
+            self._pending_rep_tokens.extend(stripped.split())
+            logger.debug(
+                "[AGGREGATOR] Added bank rep (user) fragment #{}: '{:.50}...'",
+                len(self.pending_rep_fragments),
+                stripped,
+            )
             return None
                 
         else:
-            logger.warning(f"[AGGREGATOR] Unknown role: {role}")
+            logger.warning("[AGGREGATOR] Unknown role: {}", role)
             return None
     
-    def flush_pending_turn(self) -> Optional[Tuple[str, str]]:
+    def flush_pending_turn(self) -> Optional[TurnPair]:
         """
         Flush any pending turn at the end of conversation.
         Returns the final turn if there's a pending customer prompt with representative response.
         """
         if self.pending_customer_prompt and self.pending_rep_fragments:
-            aggregated_rep = " ".join(self.pending_rep_fragments)
-            aggregated_rep = " ".join(aggregated_rep.split())  # Clean spaces
+            aggregated_rep = " ".join(self._pending_rep_tokens)
             
             customer_prompt = self.pending_customer_prompt
             self._turn_count += 1
@@ -146,19 +192,25 @@ class ConversationAggregator:
             # Store completed turn
             turn = ConversationTurn(
                 customer_prompt=customer_prompt,
-                representative_responses=self.pending_rep_fragments.copy()
+                representative_responses=self.pending_rep_fragments,
             )
             self.completed_turns.append(turn)
             
-            logger.info(f"[AGGREGATOR] Flushing final turn #{self._turn_count}:")
-            logger.info(f"  Customer (assistant): '{customer_prompt[:100]}...'")
-            logger.info(f"  Representative (user): '{aggregated_rep[:100]}...'")
+            logger.info(
+                "[AGGREGATOR] Flushing final turn #{}:\n"
+                "  Customer (assistant): '{:.100}...'\n"
+                "  Representative (user): '{:.100}...'",
+                self._turn_count,
+                customer_prompt,
+                aggregated_rep,
+            )
             
             # Clear state
             self.pending_customer_prompt = None
-            self.pending_rep_fragments = []
+            self.pending_rep_fragments = []  # The flushed turn now owns the old list
+            self._pending_rep_tokens.clear()
             
-            return (customer_prompt, aggregated_rep)
+            return TurnPair(customer_prompt, aggregated_rep)
         return None
     
     def get_pending_representative_response(self) -> Optional[str]:
@@ -168,8 +220,7 @@ class ConversationAggregator:
         """
         if not self.pending_rep_fragments:
             return None
-        aggregated = " ".join(self.pending_rep_fragments)
-        return " ".join(aggregated.split())  # Clean up spaces
+        return " ".join(self._pending_rep_tokens)
     
     def get_last_complete_turn(self) -> Optional[ConversationTurn]:
         """Get the most recent complete conversation turn."""
@@ -182,24 +233,29 @@ class ConversationAggregator:
     def reset(self):
         """Clear all state and start fresh."""
         self.pending_customer_prompt = None
-        self.pending_rep_fragments = []
-        self.completed_turns = []
+        self.pending_rep_fragments.clear()
+        self._pending_rep_tokens.clear()
+        self.completed_turns.clear()
         self._turn_count = 0
         logger.info("[AGGREGATOR] State reset")
     
     def get_conversation_summary(self) -> str:
         """Get a summary of the conversation flow for debugging."""
-        lines = [f"[AGGREGATOR] Conversation Summary: {self._turn_count} completed turns"]
-        for i, turn in enumerate(self.completed_turns, 1):
+        return "\n".join(self._summary_lines())
+
+    def _summary_lines(self) -> Iterator[str]:
+        yield f"[AGGREGATOR] Conversation Summary: {self._turn_count} completed turns"
+        # Older turns may have dropped out of the bounded history
+        first = self._turn_count - len(self.completed_turns) + 1
+        for i, turn in enumerate(self.completed_turns, first):
             customer_msg = turn.customer_prompt or "None"
             rep_msg = turn.get_aggregated_representative_response()
-            lines.append(f"  Turn {i}:")
-            lines.append(f"    Customer (assistant): {customer_msg[:80]}...")
-            lines.append(f"    Representative (user): {rep_msg[:80]}...")
+            yield f"  Turn {i}:"
+            yield f"    Customer (assistant): {customer_msg[:80]}..."
+            yield f"    Representative (user): {rep_msg[:80]}..."
         if self.pending_customer_prompt:
-            lines.append(f"  Pending customer prompt: {self.pending_customer_prompt[:80]}...")
+            yield f"  Pending customer prompt: {self.pending_customer_prompt[:80]}..."
         if self.pending_rep_fragments:
-            lines.append(f"  Pending rep fragments: {len(self.pending_rep_fragments)}")
+            yield f"  Pending rep fragments: {len(self.pending_rep_fragments)}"
             for frag in self.pending_rep_fragments:
-                lines.append(f"    - {frag[:50]}...")
-        return "\n".join(lines)
\ No newline at end of file
+                yield f"    - {frag[:50]}..."
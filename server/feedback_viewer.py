@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Lightweight web viewer for coach feedback JSON files.
-No external dependencies - uses only Python standard library.
+Uses the Python standard library plus orjson for serialization.
 
 Usage:
     uv run feedback_viewer.py [--port PORT]
@@ -9,37 +9,24 @@ Usage:
 Access at: http://localhost:8080
 """
 
-import json
+import gzip
+import hashlib
 import os
 import re
 import sys
+import threading
+import time
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 import argparse
 
+import orjson
 
-class FeedbackViewerHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for the feedback viewer."""
-    
-    def do_GET(self):
-        """Handle GET requests."""
-        parsed = urlparse(self.path)
-        path = parsed.path
-        
-        if path == '/':
-            self.serve_home()
-        elif path == '/api/sessions':
-            self.serve_sessions_list()
-        elif path == '/api/session':
-            self.serve_session_data(parsed)
-        else:
-            self.send_error(404, "Not Found")
-    
-    def serve_home(self):
-        """Serve the main HTML page."""
-        html = """<!DOCTYPE html>
+
+# The viewer page is static: encode it once and serve the same bytes to every request
+_HOME_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>Coach Feedback Viewer</title>
@@ -249,29 +236,7 @@ class FeedbackViewerHandler(BaseHTTPRequestHandler):
         async function loadSessions() {
             try {
                 const response = await fetch('/api/sessions');
-                const sessions = await response.json();
-                
-                const container = document.getElementById('sessions');
-                if (sessions.length === 0) {
-                    container.innerHTML = '<div class="no-data">No feedback sessions found</div>';
-                    return;
-                }
-                
-                container.innerHTML = sessions.map(session => `
-                    <div class="session-item ${session.file === currentSession ? 'active' : ''}" 
-                         onclick="loadSession('${session.file}')">
-                        <strong>${session.scenario || 'Unknown'}</strong> - ${session.timestamp}
-                        <span class="timestamp">${session.file}</span>
-                    </div>
-                `).join('');
-                
-                // Auto-load the most recent session if none selected
-                if (!currentSession && sessions.length > 0) {
-                    loadSession(sessions[0].file);
-                } else if (currentSession) {
-                    // Refresh current session data without resetting UI state
-                    refreshCurrentSession();
-                }
+                renderSessions(await response.json());
             } catch (error) {
                 console.error('Failed to load sessions:', error);
                 document.getElementById('sessions').innerHTML = 
@@ -279,6 +244,35 @@ class FeedbackViewerHandler(BaseHTTPRequestHandler):
             }
         }
         
+        function renderSessions(sessions) {
+            const container = document.getElementById('sessions');
+            // A live session's .jsonl is replaced by its .json once the session ends
+            if (currentSession && currentSession.endsWith('.jsonl')) {
+                const finalized = currentSession.slice(0, -1);
+                if (sessions.some(s => s.file === finalized)) currentSession = finalized;
+            }
+            if (sessions.length === 0) {
+                container.innerHTML = '<div class="no-data">No feedback sessions found</div>';
+                return;
+            }
+            
+            container.innerHTML = sessions.map(session => `
+                <div class="session-item ${session.file === currentSession ? 'active' : ''}" 
+                     onclick="loadSession('${session.file}')">
+                    <strong>${session.scenario || 'Unknown'}</strong> - ${session.timestamp}
+                    <span class="timestamp">${session.file}</span>
+                </div>
+            `).join('');
+            
+            // Auto-load the most recent session if none selected
+            if (!currentSession && sessions.length > 0) {
+                loadSession(sessions[0].file);
+            } else if (currentSession) {
+                // Refresh current session data without resetting UI state
+                refreshCurrentSession();
+            }
+        }
+        
         async function refreshCurrentSession() {
             if (!currentSession) return;
             
@@ -432,66 +426,260 @@ class FeedbackViewerHandler(BaseHTTPRequestHandler):
             return (text || '').replace(/[&<>"']/g, m => map[m]);
         }
         
-        // Load sessions on page load
-        loadSessions();
-        
-        // Auto-refresh every 3 seconds
-        setInterval(loadSessions, 3000);
+        // The server pushes the sessions list on connect and whenever a feedback
+        // file changes; fall back to polling every 3 seconds without EventSource
+        if (window.EventSource) {
+            new EventSource('/api/stream').onmessage = e => renderSessions(JSON.parse(e.data));
+        } else {
+            loadSessions();
+            setInterval(loadSessions, 3000);
+        }
     </script>
 </body>
 </html>"""
+_HOME_HTML_BYTES = _HOME_HTML.encode("utf-8")
+_HOME_CONTENT_LENGTH = str(len(_HOME_HTML_BYTES))
+_HOME_ETAG = f'"{hashlib.sha1(_HOME_HTML_BYTES).hexdigest()}"'
+
+
+# Serialized /api/sessions response as (key, body, gzipped body, etag), keyed on
+# (name, mtime_ns, size) of every feedback file. Replaced as a whole so request
+# threads never see a torn entry.
+_sessions_cache = (None, b"[]", gzip.compress(b"[]", compresslevel=1), '""')
+_sessions_cache_lock = threading.Lock()
+
+# Gzipped session files as filename -> (etag, gzipped body), so each version of a
+# file is compressed once no matter how many clients poll it
+_session_gzip_cache = {}
+
+
+# /api/stream checks for changes this often, and sends a comment line when idle so
+# proxies and browsers keep the connection open
+_STREAM_POLL_S = 1.0
+_STREAM_KEEPALIVE_S = 15.0
+
+
+def _gzip_etag(etag):
+    """ETag of the gzip-encoded representation of a response."""
+    return etag[:-1] + '-gzip"'
+
+
+# per_turn_HH_MM_SS_DD_MM_YYYY.json
+_PER_TURN_FILENAME_RE = re.compile(r'per_turn_(\d{2})_(\d{2})_(\d{2})_(\d{2})_(\d{2})_(\d{4})\.json')
+
+# Keywords in the first customer message that identify the scenario, checked in order
+_SCENARIO_KEYWORDS = (
+    ((b'card', b'lost'), "Lost Card"),
+    ((b'transfer', b'payment'), "Failed Transfer"),
+    ((b'locked', b'frozen'), "Account Locked"),
+)
+
+
+def _detect_scenario(file):
+    """Guess the scenario from the first customer message of a per_turn file.
+
+    Only the head of the file is read; the first turn's customer text sits between
+    the first "customer" and "representative" keys, so the rest of the session
+    never needs to be parsed.
+    """
+    try:
+        with open(file, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return "Unknown"
+    start = head.find(b'"customer"')
+    if start == -1:
+        return "Unknown"
+    end = head.find(b'"representative"', start)
+    first_msg = head[start + len(b'"customer"'):end if end != -1 else None].lower()
+    for keywords, scenario in _SCENARIO_KEYWORDS:
+        if any(keyword in first_msg for keyword in keywords):
+            return scenario
+    return "Unknown"
+
+
+def _build_sessions_list(files):
+    """Describe each per_turn feedback file for the sessions list."""
+    sessions = []
+    for file in files:
+        # Extract timestamp and scenario from filename
+        # Format: per_turn_HH_MM_SS_DD_MM_YYYY.json (or .jsonl while live)
+        match = _PER_TURN_FILENAME_RE.match(file.name)
+        if match:
+            hour, minute, second, day, month, year = match.groups()
+            formatted = f"{day}/{month}/{year} {hour}:{minute}:{second}"
+            
+            # Try to detect scenario from file content
+            scenario = _detect_scenario(file)
+            
+            sessions.append({
+                'file': file.name,
+                'timestamp': formatted,
+                'scenario': scenario
+            })
+    return sessions
+
+
+def _sessions_snapshot():
+    """Return (key, body, gzipped body, etag, last modified) for the sessions list.
+
+    The serialized list is rebuilt only when a feedback file was added, removed or
+    rewritten since the last call.
+    """
+    global _sessions_cache
+
+    feedback_dir = Path(__file__).parent / '.coach' / 'feedback'
+
+    # One directory pass; the filename encodes the timestamp, so sorting by name
+    # is enough and DirEntry objects stand in for Paths. A running session only has
+    # its per_turn .jsonl sidecar; once finalized, the .json array replaces it.
+    by_stem = {}
+    try:
+        with os.scandir(feedback_dir) as it:
+            for entry in it:
+                if not entry.name.startswith('per_turn_'):
+                    continue
+                stem, ext = os.path.splitext(entry.name)
+                if ext == '.json' or (ext == '.jsonl' and stem not in by_stem):
+                    by_stem[stem] = entry
+    except FileNotFoundError:
+        pass
+    stats = []
+    for entry in sorted(by_stem.values(), key=lambda entry: entry.name, reverse=True):
+        try:
+            stats.append((entry, entry.stat()))
+        except OSError:
+            # Finalizing a session removes its .jsonl after the scandir pass
+            continue
+    files = [entry for entry, _ in stats]
+
+    key = tuple((file.name, st.st_mtime_ns, st.st_size) for file, st in stats)
+    cached_key, body, gzipped, etag = _sessions_cache
+    if key != cached_key:
+        with _sessions_cache_lock:
+            # Another request may have rebuilt it while we waited
+            cached_key, body, gzipped, etag = _sessions_cache
+            if key != cached_key:
+                body = orjson.dumps(_build_sessions_list(files))
+                gzipped = gzip.compress(body, compresslevel=1)
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                _sessions_cache = (key, body, gzipped, etag)
+
+    last_modified = max((st.st_mtime for _, st in stats), default=None)
+    return key, body, gzipped, etag, last_modified
+
+
+class FeedbackViewerHandler(BaseHTTPRequestHandler):
+    """HTTP request handler for the feedback viewer."""
+
+    # Every response carries a Content-Length (or has no body), so polling browsers
+    # can keep their connection open instead of reconnecting every few seconds
+    protocol_version = 'HTTP/1.1'
+    # Buffer writes so headers and body leave in one send() for typical responses;
+    # handle_one_request() flushes after each request
+    wbufsize = 64 * 1024
+    
+    def do_GET(self):
+        """Handle GET requests."""
+        parsed = urlparse(self.path)
+        path = parsed.path
         
+        if path == '/':
+            self.serve_home()
+        elif path == '/api/sessions':
+            self.serve_sessions_list()
+        elif path == '/api/session':
+            self.serve_session_data(parsed)
+        elif path == '/api/stream':
+            self.serve_stream()
+        else:
+            self.send_error(404, "Not Found")
+    
+    def serve_home(self):
+        """Serve the main HTML page."""
+        if self.headers.get('If-None-Match') == _HOME_ETAG:
+            self.send_response(304)
+            self.send_header('ETag', _HOME_ETAG)
+            self.end_headers()
+            return
+
         self.send_response(200)
-        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', _HOME_CONTENT_LENGTH)
+        self.send_header('Cache-Control', 'public, max-age=3600')
+        self.send_header('ETag', _HOME_ETAG)
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(_HOME_HTML_BYTES)
     
     def serve_sessions_list(self):
         """Serve list of available feedback sessions as JSON."""
-        feedback_dir = Path(__file__).parent / '.coach' / 'feedback'
-        
-        sessions = []
-        if feedback_dir.exists():
-            for file in sorted(feedback_dir.glob('per_turn_*.json'), reverse=True):
-                # Extract timestamp and scenario from filename
-                # Format: per_turn_HH_MM_SS_DD_MM_YYYY.json
-                match = re.match(r'per_turn_(\d{2}_\d{2}_\d{2}_\d{2}_\d{2}_\d{4})\.json', file.name)
-                if match:
-                    timestamp_str = match.group(1)
-                    # Parse timestamp
-                    parts = timestamp_str.split('_')
-                    if len(parts) == 6:
-                        formatted = f"{parts[3]}/{parts[4]}/{parts[5]} {parts[0]}:{parts[1]}:{parts[2]}"
-                    else:
-                        formatted = timestamp_str
-                    
-                    # Try to detect scenario from file content
-                    scenario = "Unknown"
-                    try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
-                            if data and len(data) > 0:
-                                # Try to detect scenario from customer message
-                                first_msg = data[0].get('interaction', {}).get('customer', '')
-                                if 'card' in first_msg.lower() or 'lost' in first_msg.lower():
-                                    scenario = "Lost Card"
-                                elif 'transfer' in first_msg.lower() or 'payment' in first_msg.lower():
-                                    scenario = "Failed Transfer"
-                                elif 'locked' in first_msg.lower() or 'frozen' in first_msg.lower():
-                                    scenario = "Account Locked"
-                    except:
-                        pass
-                    
-                    sessions.append({
-                        'file': file.name,
-                        'timestamp': formatted,
-                        'scenario': scenario
-                    })
-        
+        key, body, gzipped, etag, last_modified = _sessions_snapshot()
+        if self._accepts_gzip():
+            self._send_json_bytes(gzipped, _gzip_etag(etag), last_modified, encoding='gzip')
+        else:
+            self._send_json_bytes(body, etag, last_modified)
+
+    def serve_stream(self):
+        """Push the sessions list as server-sent events whenever a feedback file changes."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        # The body has no length, so the connection cannot be reused afterwards
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        last_key = None
+        idle = 0.0
+        try:
+            while True:
+                key, body, _, _, _ = _sessions_snapshot()
+                if key != last_key:
+                    # Also sent when only a file's content changed, so the page
+                    # refreshes the open session
+                    self.wfile.write(b'data: ' + body + b'\n\n')
+                    self.wfile.flush()
+                    last_key = key
+                    idle = 0.0
+                elif idle >= _STREAM_KEEPALIVE_S:
+                    self.wfile.write(b': keep-alive\n\n')
+                    self.wfile.flush()
+                    idle = 0.0
+                time.sleep(_STREAM_POLL_S)
+                idle += _STREAM_POLL_S
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _accepts_gzip(self):
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+
+    def _not_modified(self, etag):
+        """Send 304 and return True if the client already holds this representation."""
+        if self.headers.get('If-None-Match') != etag:
+            return False
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        return True
+
+    def _send_json_bytes(self, body, etag, last_modified=None, encoding=None):
+        """Send a JSON body with validators, or 304 if the client copy is current."""
+        if self._not_modified(etag):
+            return
+
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('ETag', etag)
+        if last_modified is not None:
+            self.send_header('Last-Modified', self.date_time_string(last_modified))
         self.end_headers()
-        self.wfile.write(json.dumps(sessions).encode())
+        self.wfile.write(body)
     
     def serve_session_data(self, parsed):
         """Serve specific session data as JSON."""
@@ -510,21 +698,37 @@ class FeedbackViewerHandler(BaseHTTPRequestHandler):
             return
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(data).encode())
+            # The file already holds the JSON we would send, so pass its bytes through
+            st = file_path.stat()
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            encoding = None
+            if self._accepts_gzip():
+                etag, encoding = _gzip_etag(etag), 'gzip'
+            if self._not_modified(etag):
+                return
+            cached = _session_gzip_cache.get(filename) if encoding else None
+            if cached is not None and cached[0] == etag:
+                body = cached[1]
+            else:
+                body = file_path.read_bytes()
+                if file_path.suffix == '.jsonl':
+                    # Live session: one JSON object per line, served as the same array.
+                    # Anything after the last newline is a line still being written.
+                    body = b'[' + b','.join(body.split(b'\n')[:-1]) + b']'
+                if encoding:
+                    body = gzip.compress(body, compresslevel=1)
+                    _session_gzip_cache[filename] = (etag, body)
         except Exception as e:
             self.send_error(500, f"Error reading file: {str(e)}")
+            return
+        self._send_json_bytes(body, etag, st.st_mtime, encoding)
     
-    def log_message(self, format, *args):
+    def log_request(self, code='-', size='-'):
         """Override to reduce logging noise."""
-        # Only log non-200 responses
-        if not (200 <= int(args[1]) < 300):
-            super().log_message(format, *args)
+        # Only log non-200 responses (304 revalidations are expected while polling)
+        if isinstance(code, int) and (200 <= code < 300 or code == 304):
+            return
+        super().log_request(code, size)
 
 
 def main():
@@ -533,14 +737,14 @@ def main():
     args = parser.parse_args()
     
     server_address = ('', args.port)
-    httpd = HTTPServer(server_address, FeedbackViewerHandler)
+    httpd = ThreadingHTTPServer(server_address, FeedbackViewerHandler)
     
     print(f"\n🎯 Coach Feedback Viewer")
     print(f"=" * 40)
     print(f"Server running at: http://localhost:{args.port}")
     print(f"Press Ctrl+C to stop")
     print(f"=" * 40)
-    print(f"\nAuto-refreshes every 5 seconds")
+    print(f"\nPushes updates to open pages when feedback files change")
     print(f"Serving feedback from: .coach/feedback/\n")
     
     try:
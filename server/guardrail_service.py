@@ -6,13 +6,48 @@ in character and preventing off-topic or meta-conversations. All patterns are
 loaded from prompts.json for versioning and easy updates.
 """
 
+import re
 import types
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Callable, Optional, Dict, List, Tuple, Any
 from loguru import logger
 
 from prompts_loader import PromptsRepository
 
 
+# The user message that triggered this turn is at or near the end of the context; only
+# this many trailing messages are inspected for it
+_USER_MESSAGE_LOOKBACK = 4
+
+
+def _build_matcher(patterns: List[str]) -> Callable[[str], bool]:
+    """Build a predicate telling whether any of the patterns occurs in a text."""
+    if not patterns:
+        return lambda text: False
+    search = re.compile("|".join(re.escape(pattern) for pattern in patterns)).search
+    return lambda text: search(text) is not None
+
+
+def _resolve_context_accessors(context) -> Tuple[Callable, Optional[Callable], str]:
+    """Work out how to read messages from and inject a reminder into a context.
+
+    Returns (get_messages, inject, via); inject is None for an unknown context structure.
+    """
+    if hasattr(context, 'get_messages'):
+        get_messages = lambda c: c.get_messages()
+    elif hasattr(context, 'messages'):
+        get_messages = lambda c: c.messages
+    else:
+        get_messages = lambda c: []
+
+    if hasattr(context, 'add_message'):
+        return get_messages, lambda c, m: c.add_message(m), "add_message()"
+    if hasattr(context, '_messages') and isinstance(context._messages, list):
+        return get_messages, lambda c, m: c._messages.append(m), "_messages list"
+    if hasattr(context, 'messages') and isinstance(context.messages, list):
+        return get_messages, lambda c, m: c.messages.append(m), "messages list"
+    return get_messages, None, ""
+
+
 class GuardrailService:
     """Service for managing LLM guardrails from prompts.json"""
     
@@ -29,6 +64,14 @@ class GuardrailService:
             'reminders': {},
             'version': 'unknown'
         }
+        self._off_topic: List[str] = []
+        self._banking: List[str] = []
+        self._reminders: Dict[str, str] = {}
+        self._has_off_topic = False
+        self._min_pattern_len = 0
+        self._banking_words: frozenset = frozenset()
+        self._off_topic_match = _build_matcher([])
+        self._banking_match = _build_matcher([])
         self._load_patterns()
     
     def _load_patterns(self) -> None:
@@ -42,12 +85,23 @@ class GuardrailService:
             guardrail = guardrail_prompts[0]
             content = guardrail.content
             
+            # Messages are lowercased before matching, so the patterns must be too
             self.patterns = {
-                'off_topic': content.get('off_topic_patterns', []),
-                'banking_keywords': content.get('banking_context', []),
+                'off_topic': [p.lower() for p in content.get('off_topic_patterns', [])],
+                'banking_keywords': [k.lower() for k in content.get('banking_context', [])],
                 'reminders': content.get('system_reminders', {}),
                 'version': guardrail.prompt_version
             }
+            # Direct attributes for check_off_topic, which runs on every user turn
+            self._off_topic = self.patterns['off_topic']
+            self._banking = self.patterns['banking_keywords']
+            self._reminders = self.patterns['reminders']
+            self._has_off_topic = bool(self._off_topic)
+            self._min_pattern_len = min((len(p) for p in self._off_topic), default=0)
+            self._off_topic_match = _build_matcher(self._off_topic)
+            self._banking_match = _build_matcher(self._banking)
+            # Single-word keywords can be found with a set lookup per token
+            self._banking_words = frozenset(k for k in self._banking if ' ' not in k)
             
             logger.info(
                 f"[GUARDRAIL] Loaded patterns v{self.patterns['version']}: "
@@ -67,26 +121,24 @@ class GuardrailService:
         Returns:
             Tuple of (is_off_topic, reminder_message)
         """
-        if not message:
+        # Without off-topic patterns nothing can be flagged, and a message shorter than
+        # the shortest pattern cannot contain one, so skip lowercasing and both scans
+        if not message or not self._has_off_topic or len(message) < self._min_pattern_len:
             return False, None
             
         msg_lower = message.lower()
         
-        # Check if message has banking context (makes it on-topic)
-        has_banking_context = any(
-            keyword in msg_lower 
-            for keyword in self.patterns['banking_keywords']
-        )
-        
-        # Check for off-topic patterns
-        is_off_topic = any(
-            pattern in msg_lower 
-            for pattern in self.patterns['off_topic']
-        ) and not has_banking_context
+        # Banking context makes the message on-topic, so there is no need to
+        # look for off-topic patterns at all
+        if (
+            not self._banking_words.isdisjoint(msg_lower.split())
+            or self._banking_match(msg_lower)
+        ):
+            return False, None
         
-        if is_off_topic:
+        if self._off_topic_match(msg_lower):
             # Get scenario-specific reminder or use a default
-            reminder = self.patterns['reminders'].get(
+            reminder = self._reminders.get(
                 scenario,
                 "Stay in character! You're in a crisis and need help with your banking issue NOW!"
             )
@@ -113,20 +165,28 @@ class GuardrailService:
         # Capture reference to this service for use in closure
         service = self
         
+        # The pipeline hands over the same context type every turn, so the structure is
+        # probed once per type instead of on every call
+        accessors: Dict[type, Tuple[Callable, Optional[Callable], str]] = {}
+        
         async def guarded_process_context(self, context):
             """Patched _process_context that injects guardrail reminders"""
             
+            context_type = type(context)
+            resolved = accessors.get(context_type)
+            if resolved is None:
+                resolved = accessors[context_type] = _resolve_context_accessors(context)
+            get_messages, inject, via = resolved
+            
             # Extract messages from context
-            messages = []
-            if hasattr(context, 'get_messages'):
-                messages = context.get_messages()
-            elif hasattr(context, 'messages'):
-                messages = context.messages
+            messages = get_messages(context)
             
             # Find last user message
             last_user_msg = None
-            for msg in reversed(messages):
-                if isinstance(msg, dict) and msg.get('role') == 'user':
+            last = len(messages) - 1
+            for i in range(last, max(-1, last - _USER_MESSAGE_LOOKBACK), -1):
+                msg = messages[i]
+                if type(msg) is dict and msg.get('role') == 'user':
                     last_user_msg = msg.get('content', '')
                     break
             
@@ -143,16 +203,9 @@ class GuardrailService:
                         "content": reminder
                     }
                     
-                    # Try different methods to inject the reminder into context
-                    if hasattr(context, 'add_message'):
-                        context.add_message(reminder_msg)
-                        logger.debug("[GUARDRAIL] Injected reminder via add_message()")
-                    elif hasattr(context, '_messages') and isinstance(context._messages, list):
-                        context._messages.append(reminder_msg)
-                        logger.debug("[GUARDRAIL] Injected reminder via _messages list")
-                    elif hasattr(context, 'messages') and isinstance(context.messages, list):
-                        context.messages.append(reminder_msg)
-                        logger.debug("[GUARDRAIL] Injected reminder via messages list")
+                    if inject is not None:
+                        inject(context, reminder_msg)
+                        logger.debug(f"[GUARDRAIL] Injected reminder via {via}")
                     else:
                         logger.warning("[GUARDRAIL] Could not inject reminder - unknown context structure")
             
@@ -1,11 +1,27 @@
-import json
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 
 PROMPTS_PATH_DEFAULT = os.path.join(os.path.dirname(os.path.dirname(__file__)), "docs", "prompts.json")
 
+# Parsed prompts files keyed by path, with the mtime they were read at, so every
+# repository created in this process shares one parse until the file changes
+_REPO_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _read_prompts(path: str) -> Dict[str, Any]:
+    mtime = os.stat(path).st_mtime_ns
+    cached = _REPO_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    _REPO_CACHE[path] = (mtime, data)
+    return data
+
 
 @dataclass
 class Prompt:
@@ -24,11 +40,15 @@ class PromptsRepository:
         self._path = path or PROMPTS_PATH_DEFAULT
         self._data: Dict[str, Any] = {}
         self._index: Dict[str, Prompt] = {}
+        self._by_entity: Dict[str, List[Prompt]] = {}
+        self._by_entity_scenario: Dict[Tuple[str, str], List[Prompt]] = {}
+        self._name_lower: Dict[str, str] = {}
+        # Results of find() per (entity, scenario, name_contains) query
+        self._find_cache: Dict[Tuple[Optional[str], Optional[str], Optional[str]], Tuple[Prompt, ...]] = {}
         self._load()
 
     def _load(self) -> None:
-        with open(self._path, "r", encoding="utf-8") as f:
-            self._data = json.load(f)
+        self._data = _read_prompts(self._path)
         prompts: List[Dict[str, Any]] = self._data.get("prompts", [])
         for p in prompts:
             prompt = Prompt(
@@ -42,49 +62,87 @@ class PromptsRepository:
                 content=p.get("content", {}),
             )
             self._index[prompt.id] = prompt
+        # Index the final prompts so entity/scenario lookups skip the linear scan
+        for prompt in self._index.values():
+            self._by_entity.setdefault(prompt.entity, []).append(prompt)
+            self._by_entity_scenario.setdefault((prompt.entity, prompt.scenario or ""), []).append(prompt)
+            self._name_lower[prompt.id] = prompt.name.lower()
+
+        # The prompts the bot and coach ask for on every session are resolved once here;
+        # None marks one that prompts.json does not define
+        self._persona_by_scenario: Dict[str, str] = {}
+        self._scenario_info: Dict[str, Dict[str, str]] = {}
+        for prompt in self._by_entity.get("simulation_customer", []):
+            if prompt.scenario and prompt.scenario not in self._persona_by_scenario:
+                self._persona_by_scenario[prompt.scenario] = prompt.content.get("system", "")
+                self._scenario_info[prompt.scenario] = self._describe_persona(prompt)
+        self._coach_main = self._coach_content("Main System Prompt", "system", "")
+        self._coach_turn_schema = self._coach_content("Turn-by-Turn Evaluation", "json_schema", {})
+        self._coach_e2e_schema = self._coach_content("End-to-End Assessment", "json_schema", {})
+
+    def _coach_content(self, name_contains: str, key: str, default: Any) -> Any:
+        matches = self._find_cached("coach_agent", None, name_contains)
+        return matches[0].content.get(key, default) if matches else None
 
     def by_id(self, prompt_id: str) -> Prompt:
         return self._index[prompt_id]
 
     def find(self, *, entity: Optional[str] = None, scenario: Optional[str] = None, name_contains: Optional[str] = None) -> List[Prompt]:
-        results: List[Prompt] = list(self._index.values())
-        if entity:
-            results = [p for p in results if p.entity == entity]
-        if scenario:
-            results = [p for p in results if p.scenario == scenario]
+        return list(self._find_cached(entity, scenario, name_contains))
+
+    def _find_cached(self, entity: Optional[str], scenario: Optional[str], name_contains: Optional[str]) -> Tuple[Prompt, ...]:
+        # Prompts are immutable after _load, so each distinct query is filtered only once
+        key = (entity, scenario, name_contains)
+        cached = self._find_cache.get(key)
+        if cached is None:
+            cached = self._find_cache[key] = self._filter(entity, scenario, name_contains)
+        return cached
+
+    def _filter(self, entity: Optional[str], scenario: Optional[str], name_contains: Optional[str]) -> Tuple[Prompt, ...]:
+        results: List[Prompt]
+        if entity and scenario:
+            results = self._by_entity_scenario.get((entity, scenario), [])
+        elif entity:
+            results = self._by_entity.get(entity, [])
+        elif scenario:
+            results = [p for p in self._index.values() if p.scenario == scenario]
+        else:
+            results = list(self._index.values())
         if name_contains:
-            results = [p for p in results if name_contains.lower() in p.name.lower()]
-        return results
+            needle = name_contains.lower()
+            results = [p for p in results if needle in self._name_lower[p.id]]
+        return tuple(results)
 
     def persona_system_prompt_for_scenario(self, scenario: str) -> str:
-        matches = self.find(entity="simulation_customer", scenario=scenario)
-        if not matches:
+        prompt = self._persona_by_scenario.get(scenario)
+        if prompt is None:
             raise KeyError(f"No persona prompt found for scenario '{scenario}'")
-        return matches[0].content.get("system", "")
+        return prompt
 
     def coach_main_system_prompt(self) -> str:
-        matches = self.find(entity="coach_agent", name_contains="Main System Prompt")
-        if not matches:
+        if self._coach_main is None:
             raise KeyError("No coach main system prompt found")
-        return matches[0].content.get("system", "")
+        return self._coach_main
 
     def coach_turn_eval_schema(self) -> Dict[str, Any]:
-        matches = self.find(entity="coach_agent", name_contains="Turn-by-Turn Evaluation")
-        if not matches:
+        if self._coach_turn_schema is None:
             raise KeyError("No coach turn evaluation prompt found")
-        return matches[0].content.get("json_schema", {})
+        return self._coach_turn_schema
 
     def coach_e2e_schema(self) -> Dict[str, Any]:
-        matches = self.find(entity="coach_agent", name_contains="End-to-End Assessment")
-        if not matches:
+        if self._coach_e2e_schema is None:
             raise KeyError("No coach end-to-end prompt found")
-        return matches[0].content.get("json_schema", {})
+        return self._coach_e2e_schema
 
     def scenario_info(self, scenario: str) -> Dict[str, str]:
-        matches = self.find(entity="simulation_customer", scenario=scenario)
-        if not matches:
+        info = self._scenario_info.get(scenario)
+        if info is None:
             raise KeyError(f"No persona prompt found for scenario '{scenario}'")
-        p = matches[0]
+        # Callers get their own copy so the precomputed entry can't be modified
+        return dict(info)
+
+    @staticmethod
+    def _describe_persona(p: Prompt) -> Dict[str, str]:
         system_text = (p.content or {}).get("system", "").strip()
         brief = system_text.split(". ")[0].strip() if system_text else ""
         if len(brief) > 200:
@@ -97,5 +155,3 @@ class PromptsRepository:
 
 
 __all__ = ["PromptsRepository", "Prompt", "PROMPTS_PATH_DEFAULT"]
-
-
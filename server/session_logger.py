@@ -1,12 +1,20 @@
-import json
+import asyncio
+import atexit
 import os
+import queue
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+from loguru import logger
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
+# Session files are flushed at most once per window; ASR interim bursts within it share
+# one write
+_FLUSH_INTERVAL_S = 0.25
+# Queued to make the writer thread do a last flush and exit
+_STOP = object()
 
 
 def _now_str() -> str:
@@ -14,7 +22,7 @@ def _now_str() -> str:
     return time.strftime("%H_%M_%S_%d_%m_%Y", time.localtime())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TranscriptEntry:
     ts_ms: int
     ts: str
@@ -26,9 +34,11 @@ class SessionLogger:
     """File-based session logger for transcripts and coach outputs.
 
     Files are written to:
-      server/.coach/transcripts/transcript_<STAMP>.json
-      server/.coach/transcripts/transcript_with_interims_<STAMP>.json
-      server/.coach/feedback/per_turn_<STAMP>.json
+      server/.coach/transcripts/transcript_<STAMP>.jsonl
+      server/.coach/transcripts/transcript_<STAMP>.json (snapshot_transcript)
+      server/.coach/transcripts/transcript_with_interims_<STAMP>.jsonl
+      server/.coach/feedback/per_turn_<STAMP>.jsonl (live, while the session runs)
+      server/.coach/feedback/per_turn_<STAMP>.json (finalize_per_turn)
       server/.coach/feedback/summary_<STAMP>_<SCENARIO>.json
     """
 
@@ -49,16 +59,46 @@ class SessionLogger:
         self._session_evals_dir = session_evals_dir
         self._scenario = scenario
         self._session_id = stamp
-        self._transcript_path = os.path.join(transcripts_dir, f"transcript_{stamp}.json")
-        self._interim_transcript_path = os.path.join(transcripts_dir, f"transcript_with_interims_{stamp}.json")
+        self._transcript_path = os.path.join(transcripts_dir, f"transcript_{stamp}.jsonl")
+        self._transcript_snapshot_path = os.path.join(transcripts_dir, f"transcript_{stamp}.json")
+        self._interim_transcript_path = os.path.join(transcripts_dir, f"transcript_with_interims_{stamp}.jsonl")
         self._per_turn_path = os.path.join(feedback_dir, f"per_turn_{stamp}.json")
+        self._per_turn_jsonl_path = os.path.join(feedback_dir, f"per_turn_{stamp}.jsonl")
         self._summary_path = os.path.join(feedback_dir, f"summary_{stamp}_{scenario}.json")
         self._session_eval_path = os.path.join(session_evals_dir, f"session_eval_{stamp}.md")
 
         self._transcript: List[TranscriptEntry] = []
+        # Dict form of _transcript, kept in lockstep for the session assessment
+        self._transcript_dicts: List[Dict[str, Any]] = []
         self._interim_transcript: List[Dict[str, Any]] = []
         self._coach_turns: List[Dict[str, Any]] = []
 
+        # Transcripts are append-only JSONL: each flush writes just the entries added
+        # since the previous one instead of re-serializing the whole session
+        self._transcript_fp = open(self._transcript_path, "ab")
+        self._interim_fp = open(self._interim_transcript_path, "ab")
+        self._transcript_flushed = 0
+        self._interim_flushed = 0
+        # Coach turns are appended the same way; the sidecar is opened on the first turn
+        # so sessions without feedback leave no empty file for the viewer to list
+        self._per_turn_fp = None
+        self._per_turn_flushed = 0
+
+        # Session files are written by a dedicated thread so STT/coach callbacks never
+        # block on disk I/O, whether or not they run on an event loop. The queue only
+        # carries wake-ups; flush markers record what the next batch still has to write.
+        self._write_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name=f"session-writer-{stamp}", daemon=True
+        )
+        self._writer_thread.start()
+        self._last_sec = -1
+        self._last_ts_str = ""
+        # Whatever is still pending when the process exits gets written out
+        atexit.register(self.close)
+
     @property
     def base_dir(self) -> str:
         return self._base_dir
@@ -69,31 +109,165 @@ class SessionLogger:
 
     @property
     def per_turn_path(self) -> str:
+        """Final per-turn JSON array; only written by finalize_per_turn() at session end."""
         return self._per_turn_path
+
+    @property
+    def per_turn_jsonl_path(self) -> str:
+        """Per-turn JSONL sidecar that coach turns are appended to during the session."""
+        return self._per_turn_jsonl_path
     
     @property
     def session_id(self) -> str:
         return self._session_id
 
+    def _stamp(self) -> Tuple[int, str]:
+        """Return (epoch ms, formatted local time), formatting once per wall-clock second.
+
+        Interim ASR bursts land many entries within the same second; they share the string.
+        """
+        t = time.time()
+        sec = int(t)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts_str = time.strftime("%H:%M:%S %d-%m-%Y", time.localtime(sec))
+        return int(t * 1000), self._last_ts_str
+
     def append_transcript(self, role: str, content: str, is_interim: bool = False) -> None:
-        entry = TranscriptEntry(
-            ts_ms=_now_ms(), 
-            ts=time.strftime("%H:%M:%S %d-%m-%Y", time.localtime()), 
-            role=role, 
-            content=content
-        )
+        ts_ms, ts = self._stamp()
         
         if not is_interim:
             # Final transcriptions go to main transcript
-            self._transcript.append(entry)
-            self._flush_transcript()
+            self._transcript.append(TranscriptEntry(
+                ts_ms=ts_ms, 
+                ts=ts, 
+                role=role, 
+                content=content
+            ))
+            self._transcript_dicts.append({
+                "ts_ms": ts_ms,
+                "ts": ts,
+                "role": role,
+                "content": content,
+            })
         
-        # All messages (including interims) go to interim transcript
+        # All messages (including interims) go to interim transcript; the dict is built
+        # directly since interims arrive many times a second
         self._interim_transcript.append({
-            **asdict(entry),
-            "is_interim": is_interim
+            "ts_ms": ts_ms,
+            "ts": ts,
+            "role": role,
+            "content": content,
+            "is_interim": is_interim,
         })
-        self._flush_interim_transcript()
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Wake the writer thread.
+
+        Transcript, interim and per-turn updates that land in the same flush window
+        are written together in one batch.
+        """
+        self._write_q.put(None)
+
+    def _writer_loop(self) -> None:
+        while True:
+            stop = self._write_q.get() is _STOP
+            if not stop:
+                # Coalesce the burst, then drain the wake-ups it produced
+                time.sleep(_FLUSH_INTERVAL_S)
+                try:
+                    while True:
+                        if self._write_q.get_nowait() is _STOP:
+                            stop = True
+                except queue.Empty:
+                    pass
+            try:
+                self.flush_sync()
+            except Exception as e:
+                logger.error(f"[SESSION] Session file flush failed: {e}")
+            if stop:
+                return
+
+    def flush_sync(self) -> None:
+        """Write everything appended so far before returning."""
+        with self._flush_lock:
+            self._write_dirty(*self._take_dirty())
+
+    def _take_dirty(self):
+        """Snapshot pending session writes on the calling thread and reset the markers.
+
+        Each list holds only the entries not yet appended to its JSONL file. The lists
+        only ever grow, so reading each length once keeps concurrent appends for the
+        next batch.
+        """
+        n_transcript = len(self._transcript)
+        n_interim = len(self._interim_transcript)
+        n_per_turn = len(self._coach_turns)
+        transcript = self._transcript[self._transcript_flushed:n_transcript]
+        interim = self._interim_transcript[self._interim_flushed:n_interim]
+        per_turn = self._coach_turns[self._per_turn_flushed:n_per_turn]
+        self._transcript_flushed = n_transcript
+        self._interim_flushed = n_interim
+        self._per_turn_flushed = n_per_turn
+        return transcript, interim, per_turn
+
+    def _write_dirty(
+        self,
+        transcript: List[TranscriptEntry],
+        interim: List[Dict[str, Any]],
+        per_turn: List[Dict[str, Any]],
+    ) -> None:
+        """Write one batch: every file touched since the last flush, in a single pass."""
+        if transcript:
+            self._append_jsonl(self._transcript_fp, transcript)
+        if interim:
+            self._append_jsonl(self._interim_fp, interim)
+        if per_turn:
+            if self._per_turn_fp is None:
+                self._per_turn_fp = open(self._per_turn_jsonl_path, "ab")
+            self._append_jsonl(self._per_turn_fp, per_turn)
+
+    def _append_jsonl(self, fp, rows: List[Any]) -> None:
+        # One write and one flush per batch
+        data = b"".join(orjson.dumps(row) + b"\n" for row in rows)
+        with self._write_lock:
+            fp.write(data)
+            fp.flush()
+
+    def _write_json(self, path: str, payload: Any) -> None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        with self._write_lock:
+            self._atomic_write(path, data)
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        """Replace path with data so readers (e.g. the feedback viewer) never see a partial file.
+
+        Only whole-document outputs go through here; the JSONL files are plain appends.
+        """
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    async def aclose(self) -> None:
+        """Stop the writer thread and flush anything still pending, off the event loop."""
+        await asyncio.to_thread(self.close)
+
+    def close(self) -> None:
+        """Flush anything still pending, close the JSONL files and finalize per-turn feedback.
+
+        Safe to call twice.
+        """
+        if self._transcript_fp.closed:
+            return
+        atexit.unregister(self.close)
+        self._write_q.put(_STOP)
+        self._writer_thread.join()
+        self.flush_sync()
+        self._transcript_fp.close()
+        self._interim_fp.close()
+        self.finalize_per_turn()
 
     def append_coach_turn(self, turn_index: int, customer_message: str, representative_response: str, evaluation: Dict[str, Any]) -> None:
         """Append coach evaluation for a conversation turn.
@@ -104,9 +278,10 @@ class SessionLogger:
             representative_response: How the bank rep (user) responded
             evaluation: The coach's evaluation of the representative's response
         """
+        ts_ms, ts = self._stamp()
         entry = {
-            "ts_ms": _now_ms(),
-            "ts": time.strftime("%H:%M:%S %d-%m-%Y", time.localtime()),
+            "ts_ms": ts_ms,
+            "ts": ts,
             "turn": turn_index,
             "interaction": {
                 "customer": customer_message,  # The customer (assistant) speaks first
@@ -115,39 +290,43 @@ class SessionLogger:
             "coaching": evaluation,
         }
         self._coach_turns.append(entry)
-        self._flush_per_turn()
+        self._schedule_flush()
 
     def _flush_transcript(self) -> str:
-        with open(self._transcript_path, "w", encoding="utf-8") as f:
-            json.dump([asdict(t) for t in self._transcript], f, indent=2)
-        return self._transcript_path
+        self._write_json(self._transcript_snapshot_path, self._transcript)
+        return self._transcript_snapshot_path
 
     def snapshot_transcript(self) -> str:
+        """Consolidate the final transcript into a single JSON array file."""
         return self._flush_transcript()
 
-    def _flush_per_turn(self) -> str:
-        with open(self._per_turn_path, "w", encoding="utf-8") as f:
-            json.dump(self._coach_turns, f, indent=2)
+    def finalize_per_turn(self) -> Optional[str]:
+        """Roll the per-turn JSONL sidecar up into the final per_turn JSON array.
+
+        Runs once at session end (close() calls it); the sidecar is removed once the
+        array is in place. Returns None when the session produced no coach turns.
+        """
+        if self._per_turn_fp is not None:
+            self._per_turn_fp.close()
+            self._per_turn_fp = None
+        if not self._coach_turns:
+            return None
+        self._write_json(self._per_turn_path, self._coach_turns)
+        try:
+            os.remove(self._per_turn_jsonl_path)
+        except FileNotFoundError:
+            pass
         return self._per_turn_path
     
-    def _flush_interim_transcript(self) -> str:
-        with open(self._interim_transcript_path, "w", encoding="utf-8") as f:
-            json.dump(self._interim_transcript, f, indent=2)
-        return self._interim_transcript_path
-
     def write_summary(self, summary: Dict[str, Any]) -> str:
-        with open(self._summary_path, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2)
+        self._atomic_write(self._summary_path, orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         return self._summary_path
     
     def write_session_eval(self, markdown_content: str) -> str:
         """Write session evaluation markdown file."""
-        with open(self._session_eval_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
+        self._atomic_write(self._session_eval_path, markdown_content.encode("utf-8"))
         return self._session_eval_path
     
     def get_transcript_for_assessment(self) -> List[Dict[str, Any]]:
         """Get the transcript entries for assessment (no interims)."""
-        return [asdict(t) for t in self._transcript]
-
-
+        return list(self._transcript_dicts)